@@ -5,11 +5,48 @@ This module centralizes constant values used across the application
 to ensure consistency and ease of maintenance.
 """
 
-from typing import Set, List, Dict
+import sys
+from enum import StrEnum
+from typing import Set, List, Dict, Iterable, NamedTuple, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+# Canonical instances of every tuple built by _intern_strings
+_TUPLE_POOL: Dict[Tuple[type, tuple], tuple] = {}
+
+
+def _interned_set(values: Iterable[str]) -> Set[str]:
+    """Return a set whose members are interned strings."""
+    return {sys.intern(value) for value in values}
+
+
+def _intern_strings(value: _T) -> _T:
+    """
+    Recursively intern strings and share equal tuples across constant tables.
+
+    Domain names and word-bank phrases are long multi-word strings that
+    CPython does not intern automatically, and many of them repeat across
+    tables. Interning them keeps one object per distinct phrase, and lets
+    dict lookups keyed by a validated (interned) domain short-circuit on
+    identity instead of comparing string contents.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(key): _intern_strings(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(item) for item in value]
+    if isinstance(value, tuple):
+        items = [_intern_strings(item) for item in value]
+        frozen = type(value)(*items) if hasattr(value, "_fields") else tuple(items)
+        # Key on the type too so a named tuple is never swapped for a plain one
+        return _TUPLE_POOL.setdefault((type(frozen), frozen), frozen)
+    return value
+
 
 # The single source of truth for valid domain names.
 # Using a set for efficient membership testing (e.g., `in VALID_DOMAINS`).
-VALID_DOMAINS: Set[str] = {
+VALID_DOMAINS: Set[str] = _interned_set({
     # Design & User Experience
     "product design", "user interface design", "user experience design", "industrial design",
     "graphic design", "interior design", "fashion design", "architectural design",
@@ -48,11 +85,31 @@ VALID_DOMAINS: Set[str] = {
 
     # General/Other
     "general innovation", "cross-industry solutions", "emerging technologies", "social innovation"
-}
+})
+
 
+class Domain(StrEnum):
+    """
+    Domains with dedicated analogy, biomimicry, or perspective tables,
+    plus the default domain used when no context is supplied.
+
+    Members compare and hash equal to their string values, so they can be
+    passed anywhere a domain string is accepted and used directly as keys
+    into the domain tables.
+    """
+    ARTIFICIAL_INTELLIGENCE = "artificial intelligence"
+    BUSINESS_STRATEGY = "business strategy"
+    CYBERSECURITY = "cybersecurity"
+    EDUCATIONAL_TECHNOLOGY = "educational technology"
+    GENERAL_INNOVATION = "general innovation"
+    HEALTHCARE_TECHNOLOGY = "healthcare technology"
+    PRODUCT_DESIGN = "product design"
+    RENEWABLE_ENERGY = "renewable energy"
+    SUSTAINABLE_AGRICULTURE = "sustainable agriculture"
+    URBAN_TRANSPORTATION = "urban transportation"
 
 # Generic random words for association
-RANDOM_WORDS: List[str] = [
+RANDOM_WORDS: List[str] = _intern_strings([
     "butterfly", "quantum", "mirror", "whisper", "gravity", "crystal", "shadow",
     "lightning", "ocean", "mountain", "forest", "desert", "volcano", "glacier",
     "spiral", "rhythm", "harmony", "chaos", "balance", "flow", "energy",
@@ -62,475 +119,699 @@ RANDOM_WORDS: List[str] = [
     "moon", "sun", "earth", "fire", "water", "air", "metal", "wood",
     "silk", "velvet", "diamond", "pearl", "gold", "silver", "copper",
     "magnet", "prism", "lens", "telescope", "microscope", "kaleidoscope"
-]
+])
 
 # Generic analogical thinking domains
-ANALOGICAL_DOMAINS: Dict[str, List[str]] = {
-    "nature": ["ant colonies", "bird flocks", "tree root systems", "coral reefs", "beehives"],
-    "sports": ["team coordination", "strategic plays", "training regimens", "equipment design", "performance optimization"],
-    "music": ["orchestral harmony", "improvisation", "rhythm patterns", "instrument design", "sound mixing"],
-    "cooking": ["recipe development", "flavor combinations", "cooking techniques", "kitchen organization", "presentation"],
-    "architecture": ["structural design", "space utilization", "material selection", "environmental integration", "aesthetic balance"],
-    "transportation": ["traffic flow", "route optimization", "vehicle design", "logistics systems", "navigation methods"],
-    "games": ["rule systems", "strategy development", "player interaction", "challenge progression", "reward mechanisms"]
-}
+ANALOGICAL_DOMAINS: Dict[str, Tuple[str, ...]] = _intern_strings({
+    "nature": ("ant colonies", "bird flocks", "tree root systems", "coral reefs", "beehives"),
+    "sports": ("team coordination", "strategic plays", "training regimens", "equipment design", "performance optimization"),
+    "music": ("orchestral harmony", "improvisation", "rhythm patterns", "instrument design", "sound mixing"),
+    "cooking": ("recipe development", "flavor combinations", "cooking techniques", "kitchen organization", "presentation"),
+    "architecture": ("structural design", "space utilization", "material selection", "environmental integration", "aesthetic balance"),
+    "transportation": ("traffic flow", "route optimization", "vehicle design", "logistics systems", "navigation methods"),
+    "games": ("rule systems", "strategy development", "player interaction", "challenge progression", "reward mechanisms")
+})
+
+
+class BiomimicryExample(NamedTuple):
+    """A natural system paired with the mechanism and property it inspires."""
+    organism: str
+    mechanism: str
+    property: str
+
 
 # Generic biomimicry examples
-BIOMIMICRY_EXAMPLES: List[Dict[str, str]] = [
-    {"organism": "gecko feet", "mechanism": "uses van der Waals forces for adhesion", "property": "reversible sticking ability"},
-    {"organism": "shark skin", "mechanism": "reduces drag with dermal denticles", "property": "hydrodynamic efficiency"},
-    {"organism": "lotus leaves", "mechanism": "self-clean with micro/nano structures", "property": "superhydrophobic surface"},
-    {"organism": "spider silk", "mechanism": "combines strength and flexibility", "property": "optimal material properties"},
-    {"organism": "bird wings", "mechanism": "generate lift through airfoil shape", "property": "efficient flight dynamics"},
-    {"organism": "honeycomb", "mechanism": "maximizes storage with minimal material", "property": "structural efficiency"},
-    {"organism": "cactus spines", "mechanism": "collect water from air", "property": "moisture harvesting"},
-    {"organism": "butterfly wings", "mechanism": "create colors through interference", "property": "structural coloration"},
-    {"organism": "echolocation", "mechanism": "uses sound waves for navigation", "property": "acoustic sensing"},
-    {"organism": "photosynthesis", "mechanism": "converts light to chemical energy", "property": "energy transformation"}
-]
+BIOMIMICRY_EXAMPLES: Tuple[BiomimicryExample, ...] = _intern_strings((
+    BiomimicryExample("gecko feet", "uses van der Waals forces for adhesion", "reversible sticking ability"),
+    BiomimicryExample("shark skin", "reduces drag with dermal denticles", "hydrodynamic efficiency"),
+    BiomimicryExample("lotus leaves", "self-clean with micro/nano structures", "superhydrophobic surface"),
+    BiomimicryExample("spider silk", "combines strength and flexibility", "optimal material properties"),
+    BiomimicryExample("bird wings", "generate lift through airfoil shape", "efficient flight dynamics"),
+    BiomimicryExample("honeycomb", "maximizes storage with minimal material", "structural efficiency"),
+    BiomimicryExample("cactus spines", "collect water from air", "moisture harvesting"),
+    BiomimicryExample("butterfly wings", "create colors through interference", "structural coloration"),
+    BiomimicryExample("echolocation", "uses sound waves for navigation", "acoustic sensing"),
+    BiomimicryExample("photosynthesis", "converts light to chemical energy", "energy transformation"),
+))
 
 # Domain-specific keywords for various creativity algorithms
-DOMAIN_KEYWORDS: Dict[str, List[str]] = {
+DOMAIN_KEYWORDS: Dict[str, Tuple[str, ...]] = _intern_strings({
     # Design & User Experience
-    "product design": ["product design", "product development", "industrial design", "design thinking"],
-    "user interface design": ["ui design", "interface design", "user interface", "frontend design"],
-    "user experience design": ["ux design", "user experience", "usability", "user research", "user journey"],
-    "graphic design": ["graphic design", "visual design", "branding", "logo design", "typography"],
+    "product design": ("product design", "product development", "industrial design", "design thinking"),
+    "user interface design": ("ui design", "interface design", "user interface", "frontend design"),
+    "user experience design": ("ux design", "user experience", "usability", "user research", "user journey"),
+    "graphic design": ("graphic design", "visual design", "branding", "logo design", "typography"),
 
     # Technology & Software
-    "software development": ["software", "programming", "coding", "development", "application"],
-    "mobile app development": ["mobile app", "ios app", "android app", "smartphone", "mobile development"],
-    "web development": ["website", "web app", "web development", "frontend", "backend"],
-    "artificial intelligence": ["artificial intelligence", "neural network", "deep learning", "ai model", "ai system"],
-    "data science": ["data analysis", "data science", "analytics", "big data", "data mining", "machine learning"],
-    "cybersecurity": ["security", "cybersecurity", "encryption", "privacy", "data protection"],
-    "cloud computing": ["cloud computing", "cloud services", "cloud infrastructure", "cloud platform"],
-    "blockchain technology": ["blockchain", "crypto", "cryptocurrency", "cryptography", "crypto token"],
+    "software development": ("software", "programming", "coding", "development", "application"),
+    "mobile app development": ("mobile app", "ios app", "android app", "smartphone", "mobile development"),
+    "web development": ("website", "web app", "web development", "frontend", "backend"),
+    "artificial intelligence": ("artificial intelligence", "neural network", "deep learning", "ai model", "ai system"),
+    "data science": ("data analysis", "data science", "analytics", "big data", "data mining", "machine learning"),
+    "cybersecurity": ("security", "cybersecurity", "encryption", "privacy", "data protection"),
+    "cloud computing": ("cloud computing", "cloud services", "cloud infrastructure", "cloud platform"),
+    "blockchain technology": ("blockchain", "crypto", "cryptocurrency", "cryptography", "crypto token"),
 
     # Business & Strategy
-    "business strategy": ["business strategy", "strategic planning", "market analysis", "competitive advantage"],
-    "digital marketing": ["marketing", "digital marketing", "social media marketing", "advertising", "promotion"],
-    "e-commerce": ["e-commerce", "online store", "retail", "shopping", "marketplace"],
-    "startup ventures": ["startup", "entrepreneurship", "venture", "innovation", "business model"],
+    "business strategy": ("business strategy", "strategic planning", "market analysis", "competitive advantage"),
+    "digital marketing": ("marketing", "digital marketing", "social media marketing", "advertising", "promotion"),
+    "e-commerce": ("e-commerce", "online store", "retail", "shopping", "marketplace"),
+    "startup ventures": ("startup", "entrepreneurship", "venture", "innovation", "business model"),
 
     # Healthcare & Medicine
-    "medical devices": ["medical device", "healthcare equipment", "diagnostic tool", "medical technology"],
-    "healthcare technology": ["health tech", "digital health", "medical software", "health app"],
-    "telemedicine": ["telemedicine", "remote healthcare", "virtual consultation", "telehealth"],
-    "patient care": ["patient care", "healthcare service", "medical treatment", "clinical care"],
+    "medical devices": ("medical device", "healthcare equipment", "diagnostic tool", "medical technology"),
+    "healthcare technology": ("health tech", "digital health", "medical software", "health app"),
+    "telemedicine": ("telemedicine", "remote healthcare", "virtual consultation", "telehealth"),
+    "patient care": ("patient care", "healthcare service", "medical treatment", "clinical care"),
 
     # Education & Learning
-    "educational technology": ["edtech", "educational technology", "learning platform", "online education"],
-    "online learning": ["online learning", "e-learning", "distance learning", "virtual classroom"],
-    "student engagement": ["student engagement", "learning experience", "educational game", "interactive learning"],
+    "educational technology": ("edtech", "educational technology", "learning platform", "online education"),
+    "online learning": ("online learning", "e-learning", "distance learning", "virtual classroom"),
+    "student engagement": ("student engagement", "learning experience", "educational game", "interactive learning"),
 
     # Environment & Sustainability
-    "renewable energy": ["renewable energy", "solar power", "wind energy", "clean energy", "green energy"],
-    "sustainable agriculture": ["sustainable farming", "organic agriculture", "eco-friendly farming", "farming solutions", "agricultural"],
-    "environmental conservation": ["conservation", "environmental protection", "sustainability", "eco-friendly"],
-    "green technology": ["green tech", "clean technology", "environmental technology"],
+    "renewable energy": ("renewable energy", "solar power", "wind energy", "clean energy", "green energy"),
+    "sustainable agriculture": ("sustainable farming", "organic agriculture", "eco-friendly farming", "farming solutions", "agricultural"),
+    "environmental conservation": ("conservation", "environmental protection", "sustainability", "eco-friendly"),
+    "green technology": ("green tech", "clean technology", "environmental technology"),
 
     # Transportation & Mobility
-    "urban transportation": ["public transport", "city transport", "urban mobility", "transit system"],
-    "electric vehicles": ["electric car", "ev", "electric vehicle", "battery vehicle"],
-    "autonomous vehicles": ["self-driving", "autonomous car", "driverless vehicle", "automated driving"],
-    "smart cities": ["smart city", "urban planning", "city infrastructure", "urban development"],
-}
+    "urban transportation": ("public transport", "city transport", "urban mobility", "transit system"),
+    "electric vehicles": ("electric car", "ev", "electric vehicle", "battery vehicle"),
+    "autonomous vehicles": ("self-driving", "autonomous car", "driverless vehicle", "automated driving"),
+    "smart cities": ("smart city", "urban planning", "city infrastructure", "urban development"),
+})
 
 # Comprehensive domain-specific creativity word banks
-DOMAIN_CREATIVITY_WORDS: Dict[str, Dict[str, List[str]]] = {
+DOMAIN_CREATIVITY_WORDS: Dict[str, Dict[str, Tuple[str, ...]]] = _intern_strings({
     # Design & User Experience
     "product design": {
-        "core_concepts": ["user needs", "functionality", "aesthetics", "usability", "innovation", "ergonomics", "form factor"],
-        "techniques": ["prototyping", "user testing", "iterative design", "design thinking", "sketching", "modeling", "validation"],
-        "metaphors": ["craftsmanship", "artistry", "problem solving", "creation", "refinement", "evolution", "harmony"],
-        "challenges": ["user adoption", "manufacturing constraints", "cost optimization", "sustainability", "market fit", "scalability"],
-        "applications": ["consumer products", "industrial design", "user interfaces", "packaging", "furniture", "tools", "devices"]
+        "core_concepts": ("user needs", "functionality", "aesthetics", "usability", "innovation", "ergonomics", "form factor"),
+        "techniques": ("prototyping", "user testing", "iterative design", "design thinking", "sketching", "modeling", "validation"),
+        "metaphors": ("craftsmanship", "artistry", "problem solving", "creation", "refinement", "evolution", "harmony"),
+        "challenges": ("user adoption", "manufacturing constraints", "cost optimization", "sustainability", "market fit", "scalability"),
+        "applications": ("consumer products", "industrial design", "user interfaces", "packaging", "furniture", "tools", "devices")
     },
     "user interface design": {
-        "core_concepts": ["user experience", "interaction design", "visual hierarchy", "accessibility", "responsiveness", "navigation"],
-        "techniques": ["wireframing", "prototyping", "user research", "usability testing", "design systems", "component design"],
-        "metaphors": ["conversation", "journey", "flow", "dialogue", "bridge", "gateway", "canvas"],
-        "challenges": ["cross-platform compatibility", "accessibility compliance", "performance optimization", "user diversity"],
-        "applications": ["web interfaces", "mobile apps", "desktop software", "kiosks", "dashboards", "control panels"]
+        "core_concepts": ("user experience", "interaction design", "visual hierarchy", "accessibility", "responsiveness", "navigation"),
+        "techniques": ("wireframing", "prototyping", "user research", "usability testing", "design systems", "component design"),
+        "metaphors": ("conversation", "journey", "flow", "dialogue", "bridge", "gateway", "canvas"),
+        "challenges": ("cross-platform compatibility", "accessibility compliance", "performance optimization", "user diversity"),
+        "applications": ("web interfaces", "mobile apps", "desktop software", "kiosks", "dashboards", "control panels")
     },
     "user experience design": {
-        "core_concepts": ["user journey", "personas", "information architecture", "interaction patterns", "emotional design"],
-        "techniques": ["user research", "journey mapping", "persona development", "usability testing", "service design"],
-        "metaphors": ["storytelling", "orchestration", "choreography", "empathy", "connection", "understanding"],
-        "challenges": ["user diversity", "context switching", "accessibility", "cross-cultural design", "behavior change"],
-        "applications": ["digital products", "service design", "customer experience", "brand interaction", "touchpoint design"]
+        "core_concepts": ("user journey", "personas", "information architecture", "interaction patterns", "emotional design"),
+        "techniques": ("user research", "journey mapping", "persona development", "usability testing", "service design"),
+        "metaphors": ("storytelling", "orchestration", "choreography", "empathy", "connection", "understanding"),
+        "challenges": ("user diversity", "context switching", "accessibility", "cross-cultural design", "behavior change"),
+        "applications": ("digital products", "service design", "customer experience", "brand interaction", "touchpoint design")
     },
     "industrial design": {
-        "core_concepts": ["form and function", "materials", "manufacturing", "sustainability", "human factors", "aesthetics"],
-        "techniques": ["CAD modeling", "rapid prototyping", "material selection", "ergonomic analysis", "design for manufacturing"],
-        "metaphors": ["sculpture", "engineering", "problem solving", "innovation", "transformation", "optimization"],
-        "challenges": ["cost constraints", "material limitations", "manufacturing complexity", "environmental impact"],
-        "applications": ["consumer electronics", "furniture", "automotive", "medical devices", "appliances", "tools"]
+        "core_concepts": ("form and function", "materials", "manufacturing", "sustainability", "human factors", "aesthetics"),
+        "techniques": ("CAD modeling", "rapid prototyping", "material selection", "ergonomic analysis", "design for manufacturing"),
+        "metaphors": ("sculpture", "engineering", "problem solving", "innovation", "transformation", "optimization"),
+        "challenges": ("cost constraints", "material limitations", "manufacturing complexity", "environmental impact"),
+        "applications": ("consumer electronics", "furniture", "automotive", "medical devices", "appliances", "tools")
     },
     "graphic design": {
-        "core_concepts": ["visual communication", "typography", "color theory", "composition", "branding", "hierarchy"],
-        "techniques": ["layout design", "brand development", "illustration", "photo editing", "print design", "digital design"],
-        "metaphors": ["storytelling", "visual language", "communication", "expression", "impact", "influence"],
-        "challenges": ["brand consistency", "cross-media adaptation", "cultural sensitivity", "accessibility", "trends"],
-        "applications": ["marketing materials", "brand identity", "publications", "packaging", "signage", "digital media"]
+        "core_concepts": ("visual communication", "typography", "color theory", "composition", "branding", "hierarchy"),
+        "techniques": ("layout design", "brand development", "illustration", "photo editing", "print design", "digital design"),
+        "metaphors": ("storytelling", "visual language", "communication", "expression", "impact", "influence"),
+        "challenges": ("brand consistency", "cross-media adaptation", "cultural sensitivity", "accessibility", "trends"),
+        "applications": ("marketing materials", "brand identity", "publications", "packaging", "signage", "digital media")
     },
     "interior design": {
-        "core_concepts": ["space planning", "lighting", "color schemes", "furniture selection", "functionality", "ambiance"],
-        "techniques": ["space analysis", "mood boarding", "3D visualization", "material selection", "lighting design"],
-        "metaphors": ["orchestration", "composition", "harmony", "atmosphere", "sanctuary", "transformation"],
-        "challenges": ["budget constraints", "space limitations", "client preferences", "building codes", "sustainability"],
-        "applications": ["residential spaces", "commercial interiors", "hospitality design", "retail spaces", "office design"]
+        "core_concepts": ("space planning", "lighting", "color schemes", "furniture selection", "functionality", "ambiance"),
+        "techniques": ("space analysis", "mood boarding", "3D visualization", "material selection", "lighting design"),
+        "metaphors": ("orchestration", "composition", "harmony", "atmosphere", "sanctuary", "transformation"),
+        "challenges": ("budget constraints", "space limitations", "client preferences", "building codes", "sustainability"),
+        "applications": ("residential spaces", "commercial interiors", "hospitality design", "retail spaces", "office design")
     },
     "fashion design": {
-        "core_concepts": ["silhouette", "fabric", "pattern making", "fit", "style", "trends", "functionality"],
-        "techniques": ["sketching", "draping", "pattern making", "fitting", "textile selection", "trend analysis"],
-        "metaphors": ["expression", "identity", "transformation", "artistry", "storytelling", "culture"],
-        "challenges": ["sustainability", "fast fashion", "sizing diversity", "cost management", "trend prediction"],
-        "applications": ["ready-to-wear", "haute couture", "accessories", "footwear", "activewear", "sustainable fashion"]
+        "core_concepts": ("silhouette", "fabric", "pattern making", "fit", "style", "trends", "functionality"),
+        "techniques": ("sketching", "draping", "pattern making", "fitting", "textile selection", "trend analysis"),
+        "metaphors": ("expression", "identity", "transformation", "artistry", "storytelling", "culture"),
+        "challenges": ("sustainability", "fast fashion", "sizing diversity", "cost management", "trend prediction"),
+        "applications": ("ready-to-wear", "haute couture", "accessories", "footwear", "activewear", "sustainable fashion")
     },
     "architectural design": {
-        "core_concepts": ["spatial design", "structural integrity", "environmental integration", "functionality", "aesthetics"],
-        "techniques": ["site analysis", "conceptual design", "technical drawing", "3D modeling", "sustainability planning"],
-        "metaphors": ["shelter", "community", "harmony", "permanence", "innovation", "legacy", "transformation"],
-        "challenges": ["building codes", "environmental impact", "budget constraints", "site limitations", "client needs"],
-        "applications": ["residential buildings", "commercial structures", "public spaces", "urban planning", "landscape design"]
+        "core_concepts": ("spatial design", "structural integrity", "environmental integration", "functionality", "aesthetics"),
+        "techniques": ("site analysis", "conceptual design", "technical drawing", "3D modeling", "sustainability planning"),
+        "metaphors": ("shelter", "community", "harmony", "permanence", "innovation", "legacy", "transformation"),
+        "challenges": ("building codes", "environmental impact", "budget constraints", "site limitations", "client needs"),
+        "applications": ("residential buildings", "commercial structures", "public spaces", "urban planning", "landscape design")
     },
 
     # Technology & Software
     "software development": {
-        "core_concepts": ["algorithms", "data structures", "programming languages", "software architecture", "debugging"],
-        "techniques": ["agile development", "version control", "testing", "code review", "continuous integration"],
-        "metaphors": ["construction", "craftsmanship", "problem solving", "logic", "creativity", "engineering"],
-        "challenges": ["scalability", "maintainability", "security", "performance", "technical debt", "complexity"],
-        "applications": ["web applications", "mobile apps", "desktop software", "embedded systems", "enterprise software"]
+        "core_concepts": ("algorithms", "data structures", "programming languages", "software architecture", "debugging"),
+        "techniques": ("agile development", "version control", "testing", "code review", "continuous integration"),
+        "metaphors": ("construction", "craftsmanship", "problem solving", "logic", "creativity", "engineering"),
+        "challenges": ("scalability", "maintainability", "security", "performance", "technical debt", "complexity"),
+        "applications": ("web applications", "mobile apps", "desktop software", "embedded systems", "enterprise software")
     },
     "mobile app development": {
-        "core_concepts": ["user interface", "performance optimization", "platform guidelines", "touch interaction", "offline functionality"],
-        "techniques": ["native development", "cross-platform frameworks", "app store optimization", "user analytics"],
-        "metaphors": ["pocket companion", "digital assistant", "gateway", "tool", "experience", "connection"],
-        "challenges": ["device fragmentation", "battery optimization", "app store approval", "user retention"],
-        "applications": ["productivity apps", "social media", "gaming", "e-commerce", "health tracking", "education"]
+        "core_concepts": ("user interface", "performance optimization", "platform guidelines", "touch interaction", "offline functionality"),
+        "techniques": ("native development", "cross-platform frameworks", "app store optimization", "user analytics"),
+        "metaphors": ("pocket companion", "digital assistant", "gateway", "tool", "experience", "connection"),
+        "challenges": ("device fragmentation", "battery optimization", "app store approval", "user retention"),
+        "applications": ("productivity apps", "social media", "gaming", "e-commerce", "health tracking", "education")
     },
     "web development": {
-        "core_concepts": ["frontend", "backend", "databases", "APIs", "responsive design", "web standards"],
-        "techniques": ["HTML/CSS/JavaScript", "framework development", "database design", "API development", "testing"],
-        "metaphors": ["architecture", "ecosystem", "network", "platform", "gateway", "foundation"],
-        "challenges": ["browser compatibility", "performance optimization", "security", "accessibility", "scalability"],
-        "applications": ["websites", "web applications", "e-commerce platforms", "content management", "web services"]
+        "core_concepts": ("frontend", "backend", "databases", "APIs", "responsive design", "web standards"),
+        "techniques": ("HTML/CSS/JavaScript", "framework development", "database design", "API development", "testing"),
+        "metaphors": ("architecture", "ecosystem", "network", "platform", "gateway", "foundation"),
+        "challenges": ("browser compatibility", "performance optimization", "security", "accessibility", "scalability"),
+        "applications": ("websites", "web applications", "e-commerce platforms", "content management", "web services")
     },
     "artificial intelligence": {
-        "core_concepts": ["neural networks", "machine learning", "deep learning", "algorithms", "optimization", "inference"],
-        "techniques": ["training", "validation", "feature extraction", "classification", "regression", "clustering"],
-        "metaphors": ["brain", "cognition", "learning", "adaptation", "intelligence", "reasoning", "perception"],
-        "challenges": ["bias", "interpretability", "scalability", "ethics", "robustness", "data quality"],
-        "applications": ["automation", "prediction", "recognition", "generation", "decision making", "natural language processing"]
+        "core_concepts": ("neural networks", "machine learning", "deep learning", "algorithms", "optimization", "inference"),
+        "techniques": ("training", "validation", "feature extraction", "classification", "regression", "clustering"),
+        "metaphors": ("brain", "cognition", "learning", "adaptation", "intelligence", "reasoning", "perception"),
+        "challenges": ("bias", "interpretability", "scalability", "ethics", "robustness", "data quality"),
+        "applications": ("automation", "prediction", "recognition", "generation", "decision making", "natural language processing")
     },
     "machine learning": {
-        "core_concepts": ["supervised learning", "unsupervised learning", "reinforcement learning", "model training", "feature engineering"],
-        "techniques": ["cross-validation", "hyperparameter tuning", "ensemble methods", "regularization", "dimensionality reduction"],
-        "metaphors": ["pattern recognition", "learning", "adaptation", "optimization", "discovery", "intelligence"],
-        "challenges": ["overfitting", "data scarcity", "model interpretability", "computational complexity", "generalization"],
-        "applications": ["predictive analytics", "recommendation systems", "computer vision", "natural language processing"]
+        "core_concepts": ("supervised learning", "unsupervised learning", "reinforcement learning", "model training", "feature engineering"),
+        "techniques": ("cross-validation", "hyperparameter tuning", "ensemble methods", "regularization", "dimensionality reduction"),
+        "metaphors": ("pattern recognition", "learning", "adaptation", "optimization", "discovery", "intelligence"),
+        "challenges": ("overfitting", "data scarcity", "model interpretability", "computational complexity", "generalization"),
+        "applications": ("predictive analytics", "recommendation systems", "computer vision", "natural language processing")
     },
     "data science": {
-        "core_concepts": ["data analysis", "statistical modeling", "data visualization", "big data", "analytics", "insights"],
-        "techniques": ["exploratory data analysis", "statistical testing", "machine learning", "data mining", "visualization"],
-        "metaphors": ["detective work", "storytelling", "discovery", "exploration", "insight", "understanding"],
-        "challenges": ["data quality", "missing data", "scalability", "interpretation", "bias", "privacy"],
-        "applications": ["business intelligence", "predictive analytics", "market research", "scientific research", "decision support"]
+        "core_concepts": ("data analysis", "statistical modeling", "data visualization", "big data", "analytics", "insights"),
+        "techniques": ("exploratory data analysis", "statistical testing", "machine learning", "data mining", "visualization"),
+        "metaphors": ("detective work", "storytelling", "discovery", "exploration", "insight", "understanding"),
+        "challenges": ("data quality", "missing data", "scalability", "interpretation", "bias", "privacy"),
+        "applications": ("business intelligence", "predictive analytics", "market research", "scientific research", "decision support")
     },
     "cybersecurity": {
-        "core_concepts": ["encryption", "authentication", "firewall", "intrusion detection", "vulnerability", "threat modeling"],
-        "techniques": ["penetration testing", "risk assessment", "incident response", "security auditing", "threat hunting"],
-        "metaphors": ["fortress", "shield", "guardian", "sentinel", "barrier", "protection", "defense"],
-        "challenges": ["zero-day attacks", "social engineering", "insider threats", "compliance", "evolving threats"],
-        "applications": ["network security", "data protection", "identity management", "secure communications", "fraud prevention"]
+        "core_concepts": ("encryption", "authentication", "firewall", "intrusion detection", "vulnerability", "threat modeling"),
+        "techniques": ("penetration testing", "risk assessment", "incident response", "security auditing", "threat hunting"),
+        "metaphors": ("fortress", "shield", "guardian", "sentinel", "barrier", "protection", "defense"),
+        "challenges": ("zero-day attacks", "social engineering", "insider threats", "compliance", "evolving threats"),
+        "applications": ("network security", "data protection", "identity management", "secure communications", "fraud prevention")
     },
     "cloud computing": {
-        "core_concepts": ["scalability", "elasticity", "distributed systems", "virtualization", "containerization", "microservices"],
-        "techniques": ["infrastructure as code", "auto-scaling", "load balancing", "disaster recovery", "monitoring"],
-        "metaphors": ["utility", "ecosystem", "platform", "infrastructure", "foundation", "network"],
-        "challenges": ["vendor lock-in", "security", "compliance", "cost optimization", "performance", "integration"],
-        "applications": ["web hosting", "data storage", "application deployment", "backup solutions", "development platforms"]
+        "core_concepts": ("scalability", "elasticity", "distributed systems", "virtualization", "containerization", "microservices"),
+        "techniques": ("infrastructure as code", "auto-scaling", "load balancing", "disaster recovery", "monitoring"),
+        "metaphors": ("utility", "ecosystem", "platform", "infrastructure", "foundation", "network"),
+        "challenges": ("vendor lock-in", "security", "compliance", "cost optimization", "performance", "integration"),
+        "applications": ("web hosting", "data storage", "application deployment", "backup solutions", "development platforms")
     },
     "blockchain technology": {
-        "core_concepts": ["decentralization", "consensus", "cryptography", "smart contracts", "distributed ledger", "immutability"],
-        "techniques": ["proof of work", "proof of stake", "hash functions", "digital signatures", "merkle trees"],
-        "metaphors": ["ledger", "chain", "network", "trust", "verification", "transparency", "permanence"],
-        "challenges": ["scalability", "energy consumption", "regulation", "adoption", "interoperability", "security"],
-        "applications": ["cryptocurrency", "supply chain", "digital identity", "voting systems", "financial services"]
+        "core_concepts": ("decentralization", "consensus", "cryptography", "smart contracts", "distributed ledger", "immutability"),
+        "techniques": ("proof of work", "proof of stake", "hash functions", "digital signatures", "merkle trees"),
+        "metaphors": ("ledger", "chain", "network", "trust", "verification", "transparency", "permanence"),
+        "challenges": ("scalability", "energy consumption", "regulation", "adoption", "interoperability", "security"),
+        "applications": ("cryptocurrency", "supply chain", "digital identity", "voting systems", "financial services")
     },
 
     # Business & Strategy
     "business strategy": {
-        "core_concepts": ["competitive advantage", "market positioning", "value proposition", "strategic planning", "growth strategy"],
-        "techniques": ["SWOT analysis", "market research", "competitive analysis", "strategic planning", "performance metrics"],
-        "metaphors": ["chess game", "navigation", "warfare", "ecosystem", "journey", "competition", "positioning"],
-        "challenges": ["market uncertainty", "competition", "resource constraints", "execution", "adaptation", "measurement"],
-        "applications": ["corporate strategy", "market entry", "product strategy", "digital transformation", "mergers and acquisitions"]
+        "core_concepts": ("competitive advantage", "market positioning", "value proposition", "strategic planning", "growth strategy"),
+        "techniques": ("SWOT analysis", "market research", "competitive analysis", "strategic planning", "performance metrics"),
+        "metaphors": ("chess game", "navigation", "warfare", "ecosystem", "journey", "competition", "positioning"),
+        "challenges": ("market uncertainty", "competition", "resource constraints", "execution", "adaptation", "measurement"),
+        "applications": ("corporate strategy", "market entry", "product strategy", "digital transformation", "mergers and acquisitions")
     },
     "digital marketing": {
-        "core_concepts": ["customer acquisition", "brand awareness", "conversion optimization", "customer journey", "engagement"],
-        "techniques": ["SEO", "social media marketing", "content marketing", "email marketing", "paid advertising", "analytics"],
-        "metaphors": ["conversation", "relationship", "attraction", "influence", "connection", "storytelling"],
-        "challenges": ["ad fatigue", "privacy regulations", "attribution", "ROI measurement", "channel optimization"],
-        "applications": ["lead generation", "brand building", "customer retention", "e-commerce", "B2B marketing"]
+        "core_concepts": ("customer acquisition", "brand awareness", "conversion optimization", "customer journey", "engagement"),
+        "techniques": ("SEO", "social media marketing", "content marketing", "email marketing", "paid advertising", "analytics"),
+        "metaphors": ("conversation", "relationship", "attraction", "influence", "connection", "storytelling"),
+        "challenges": ("ad fatigue", "privacy regulations", "attribution", "ROI measurement", "channel optimization"),
+        "applications": ("lead generation", "brand building", "customer retention", "e-commerce", "B2B marketing")
     },
     "e-commerce": {
-        "core_concepts": ["online marketplace", "customer experience", "payment processing", "inventory management", "logistics"],
-        "techniques": ["conversion optimization", "personalization", "recommendation engines", "A/B testing", "customer analytics"],
-        "metaphors": ["storefront", "marketplace", "journey", "ecosystem", "platform", "destination"],
-        "challenges": ["competition", "customer acquisition", "fraud prevention", "scalability", "customer service"],
-        "applications": ["online retail", "digital marketplace", "subscription services", "mobile commerce", "B2B e-commerce"]
+        "core_concepts": ("online marketplace", "customer experience", "payment processing", "inventory management", "logistics"),
+        "techniques": ("conversion optimization", "personalization", "recommendation engines", "A/B testing", "customer analytics"),
+        "metaphors": ("storefront", "marketplace", "journey", "ecosystem", "platform", "destination"),
+        "challenges": ("competition", "customer acquisition", "fraud prevention", "scalability", "customer service"),
+        "applications": ("online retail", "digital marketplace", "subscription services", "mobile commerce", "B2B e-commerce")
     },
     "startup ventures": {
-        "core_concepts": ["innovation", "disruption", "scalability", "product-market fit", "venture capital", "entrepreneurship"],
-        "techniques": ["lean startup", "MVP development", "customer validation", "pivot strategies", "fundraising"],
-        "metaphors": ["journey", "adventure", "experiment", "rocket ship", "seed", "growth", "transformation"],
-        "challenges": ["funding", "market validation", "team building", "competition", "scaling", "sustainability"],
-        "applications": ["tech startups", "social ventures", "fintech", "healthtech", "edtech", "cleantech"]
+        "core_concepts": ("innovation", "disruption", "scalability", "product-market fit", "venture capital", "entrepreneurship"),
+        "techniques": ("lean startup", "MVP development", "customer validation", "pivot strategies", "fundraising"),
+        "metaphors": ("journey", "adventure", "experiment", "rocket ship", "seed", "growth", "transformation"),
+        "challenges": ("funding", "market validation", "team building", "competition", "scaling", "sustainability"),
+        "applications": ("tech startups", "social ventures", "fintech", "healthtech", "edtech", "cleantech")
     },
     "financial services": {
-        "core_concepts": ["risk management", "investment", "banking", "insurance", "financial planning", "compliance"],
-        "techniques": ["portfolio management", "risk assessment", "financial modeling", "regulatory compliance", "customer onboarding"],
-        "metaphors": ["stewardship", "security", "growth", "protection", "foundation", "trust", "stability"],
-        "challenges": ["regulation", "cybersecurity", "market volatility", "customer trust", "digital transformation"],
-        "applications": ["banking", "investment management", "insurance", "fintech", "payment processing", "wealth management"]
+        "core_concepts": ("risk management", "investment", "banking", "insurance", "financial planning", "compliance"),
+        "techniques": ("portfolio management", "risk assessment", "financial modeling", "regulatory compliance", "customer onboarding"),
+        "metaphors": ("stewardship", "security", "growth", "protection", "foundation", "trust", "stability"),
+        "challenges": ("regulation", "cybersecurity", "market volatility", "customer trust", "digital transformation"),
+        "applications": ("banking", "investment management", "insurance", "fintech", "payment processing", "wealth management")
     },
     "supply chain management": {
-        "core_concepts": ["logistics", "inventory optimization", "supplier relationships", "demand forecasting", "distribution"],
-        "techniques": ["just-in-time", "vendor management", "demand planning", "logistics optimization", "quality control"],
-        "metaphors": ["network", "flow", "ecosystem", "pipeline", "orchestration", "coordination"],
-        "challenges": ["disruption", "cost optimization", "sustainability", "visibility", "risk management"],
-        "applications": ["manufacturing", "retail", "e-commerce", "healthcare", "automotive", "food industry"]
+        "core_concepts": ("logistics", "inventory optimization", "supplier relationships", "demand forecasting", "distribution"),
+        "techniques": ("just-in-time", "vendor management", "demand planning", "logistics optimization", "quality control"),
+        "metaphors": ("network", "flow", "ecosystem", "pipeline", "orchestration", "coordination"),
+        "challenges": ("disruption", "cost optimization", "sustainability", "visibility", "risk management"),
+        "applications": ("manufacturing", "retail", "e-commerce", "healthcare", "automotive", "food industry")
     },
     "human resources": {
-        "core_concepts": ["talent management", "employee engagement", "performance management", "organizational culture", "recruitment"],
-        "techniques": ["talent acquisition", "performance reviews", "training and development", "succession planning", "employee analytics"],
-        "metaphors": ["cultivation", "development", "community", "partnership", "investment", "growth"],
-        "challenges": ["talent retention", "diversity and inclusion", "remote work", "skills gap", "employee satisfaction"],
-        "applications": ["recruitment", "employee development", "performance management", "organizational design", "compensation"]
+        "core_concepts": ("talent management", "employee engagement", "performance management", "organizational culture", "recruitment"),
+        "techniques": ("talent acquisition", "performance reviews", "training and development", "succession planning", "employee analytics"),
+        "metaphors": ("cultivation", "development", "community", "partnership", "investment", "growth"),
+        "challenges": ("talent retention", "diversity and inclusion", "remote work", "skills gap", "employee satisfaction"),
+        "applications": ("recruitment", "employee development", "performance management", "organizational design", "compensation")
     },
     "customer service": {
-        "core_concepts": ["customer satisfaction", "support quality", "response time", "problem resolution", "customer experience"],
-        "techniques": ["multichannel support", "knowledge management", "customer feedback", "service automation", "quality assurance"],
-        "metaphors": ["assistance", "partnership", "care", "support", "guidance", "relationship"],
-        "challenges": ["scalability", "consistency", "customer expectations", "cost management", "technology integration"],
-        "applications": ["help desk", "technical support", "customer success", "complaint resolution", "service delivery"]
+        "core_concepts": ("customer satisfaction", "support quality", "response time", "problem resolution", "customer experience"),
+        "techniques": ("multichannel support", "knowledge management", "customer feedback", "service automation", "quality assurance"),
+        "metaphors": ("assistance", "partnership", "care", "support", "guidance", "relationship"),
+        "challenges": ("scalability", "consistency", "customer expectations", "cost management", "technology integration"),
+        "applications": ("help desk", "technical support", "customer success", "complaint resolution", "service delivery")
     },
     "sales optimization": {
-        "core_concepts": ["lead generation", "conversion rates", "sales funnel", "customer acquisition", "revenue growth"],
-        "techniques": ["CRM management", "sales analytics", "lead scoring", "pipeline management", "sales automation"],
-        "metaphors": ["hunting", "cultivation", "relationship building", "persuasion", "journey", "conversion"],
-        "challenges": ["lead quality", "sales cycle length", "competition", "quota achievement", "customer retention"],
-        "applications": ["B2B sales", "retail sales", "inside sales", "field sales", "e-commerce", "subscription sales"]
+        "core_concepts": ("lead generation", "conversion rates", "sales funnel", "customer acquisition", "revenue growth"),
+        "techniques": ("CRM management", "sales analytics", "lead scoring", "pipeline management", "sales automation"),
+        "metaphors": ("hunting", "cultivation", "relationship building", "persuasion", "journey", "conversion"),
+        "challenges": ("lead quality", "sales cycle length", "competition", "quota achievement", "customer retention"),
+        "applications": ("B2B sales", "retail sales", "inside sales", "field sales", "e-commerce", "subscription sales")
     },
 
     # Healthcare & Medicine
     "medical devices": {
-        "core_concepts": ["patient safety", "regulatory compliance", "biocompatibility", "clinical efficacy", "usability"],
-        "techniques": ["clinical trials", "regulatory approval", "quality assurance", "risk management", "user testing"],
-        "metaphors": ["healing tools", "precision instruments", "life support", "diagnostic aids", "therapeutic solutions"],
-        "challenges": ["FDA approval", "cost containment", "technology integration", "patient compliance", "market access"],
-        "applications": ["diagnostic equipment", "surgical instruments", "monitoring devices", "therapeutic devices", "implantables"]
+        "core_concepts": ("patient safety", "regulatory compliance", "biocompatibility", "clinical efficacy", "usability"),
+        "techniques": ("clinical trials", "regulatory approval", "quality assurance", "risk management", "user testing"),
+        "metaphors": ("healing tools", "precision instruments", "life support", "diagnostic aids", "therapeutic solutions"),
+        "challenges": ("FDA approval", "cost containment", "technology integration", "patient compliance", "market access"),
+        "applications": ("diagnostic equipment", "surgical instruments", "monitoring devices", "therapeutic devices", "implantables")
     },
     "healthcare technology": {
-        "core_concepts": ["patient care", "clinical workflows", "health data", "interoperability", "telemedicine"],
-        "techniques": ["electronic health records", "clinical decision support", "health analytics", "mobile health", "AI diagnostics"],
-        "metaphors": ["digital health", "connected care", "intelligent systems", "health ecosystem", "care coordination"],
-        "challenges": ["privacy", "interoperability", "adoption", "cost", "regulatory compliance", "data security"],
-        "applications": ["EHR systems", "telemedicine platforms", "health apps", "clinical analytics", "patient monitoring"]
+        "core_concepts": ("patient care", "clinical workflows", "health data", "interoperability", "telemedicine"),
+        "techniques": ("electronic health records", "clinical decision support", "health analytics", "mobile health", "AI diagnostics"),
+        "metaphors": ("digital health", "connected care", "intelligent systems", "health ecosystem", "care coordination"),
+        "challenges": ("privacy", "interoperability", "adoption", "cost", "regulatory compliance", "data security"),
+        "applications": ("EHR systems", "telemedicine platforms", "health apps", "clinical analytics", "patient monitoring")
     },
     "pharmaceutical research": {
-        "core_concepts": ["drug discovery", "clinical trials", "regulatory approval", "therapeutic efficacy", "safety profile"],
-        "techniques": ["compound screening", "preclinical testing", "clinical trial design", "regulatory submission", "pharmacovigilance"],
-        "metaphors": ["discovery", "development", "healing", "innovation", "breakthrough", "transformation"],
-        "challenges": ["development costs", "regulatory hurdles", "clinical trial recruitment", "market competition", "patent protection"],
-        "applications": ["drug development", "vaccine research", "personalized medicine", "rare diseases", "oncology"]
+        "core_concepts": ("drug discovery", "clinical trials", "regulatory approval", "therapeutic efficacy", "safety profile"),
+        "techniques": ("compound screening", "preclinical testing", "clinical trial design", "regulatory submission", "pharmacovigilance"),
+        "metaphors": ("discovery", "development", "healing", "innovation", "breakthrough", "transformation"),
+        "challenges": ("development costs", "regulatory hurdles", "clinical trial recruitment", "market competition", "patent protection"),
+        "applications": ("drug development", "vaccine research", "personalized medicine", "rare diseases", "oncology")
     },
     "mental health services": {
-        "core_concepts": ["psychological well-being", "therapeutic intervention", "mental health assessment", "treatment planning", "recovery"],
-        "techniques": ["cognitive behavioral therapy", "psychotherapy", "medication management", "crisis intervention", "group therapy"],
-        "metaphors": ["healing", "support", "journey", "recovery", "resilience", "empowerment", "transformation"],
-        "challenges": ["stigma", "access to care", "treatment adherence", "provider shortage", "insurance coverage"],
-        "applications": ["therapy services", "crisis intervention", "addiction treatment", "psychiatric care", "wellness programs"]
+        "core_concepts": ("psychological well-being", "therapeutic intervention", "mental health assessment", "treatment planning", "recovery"),
+        "techniques": ("cognitive behavioral therapy", "psychotherapy", "medication management", "crisis intervention", "group therapy"),
+        "metaphors": ("healing", "support", "journey", "recovery", "resilience", "empowerment", "transformation"),
+        "challenges": ("stigma", "access to care", "treatment adherence", "provider shortage", "insurance coverage"),
+        "applications": ("therapy services", "crisis intervention", "addiction treatment", "psychiatric care", "wellness programs")
     },
     "telemedicine": {
-        "core_concepts": ["remote healthcare", "virtual consultations", "digital health", "patient monitoring", "healthcare access"],
-        "techniques": ["video conferencing", "remote monitoring", "digital diagnostics", "e-prescribing", "health data integration"],
-        "metaphors": ["bridge", "connection", "accessibility", "reach", "virtual presence", "digital care"],
-        "challenges": ["technology adoption", "regulatory compliance", "reimbursement", "digital divide", "privacy"],
-        "applications": ["virtual consultations", "remote monitoring", "specialist access", "rural healthcare", "chronic care management"]
+        "core_concepts": ("remote healthcare", "virtual consultations", "digital health", "patient monitoring", "healthcare access"),
+        "techniques": ("video conferencing", "remote monitoring", "digital diagnostics", "e-prescribing", "health data integration"),
+        "metaphors": ("bridge", "connection", "accessibility", "reach", "virtual presence", "digital care"),
+        "challenges": ("technology adoption", "regulatory compliance", "reimbursement", "digital divide", "privacy"),
+        "applications": ("virtual consultations", "remote monitoring", "specialist access", "rural healthcare", "chronic care management")
     },
     "health informatics": {
-        "core_concepts": ["health data", "clinical information systems", "health analytics", "interoperability", "data standards"],
-        "techniques": ["data integration", "clinical analytics", "health information exchange", "data visualization", "predictive modeling"],
-        "metaphors": ["intelligence", "insight", "connectivity", "knowledge", "understanding", "integration"],
-        "challenges": ["data silos", "privacy", "standardization", "system integration", "data quality"],
-        "applications": ["EHR systems", "clinical decision support", "population health", "quality improvement", "research"]
+        "core_concepts": ("health data", "clinical information systems", "health analytics", "interoperability", "data standards"),
+        "techniques": ("data integration", "clinical analytics", "health information exchange", "data visualization", "predictive modeling"),
+        "metaphors": ("intelligence", "insight", "connectivity", "knowledge", "understanding", "integration"),
+        "challenges": ("data silos", "privacy", "standardization", "system integration", "data quality"),
+        "applications": ("EHR systems", "clinical decision support", "population health", "quality improvement", "research")
     },
     "medical education": {
-        "core_concepts": ["clinical training", "medical knowledge", "competency development", "simulation", "continuing education"],
-        "techniques": ["case-based learning", "simulation training", "clinical rotations", "competency assessment", "peer learning"],
-        "metaphors": ["apprenticeship", "mastery", "development", "practice", "expertise", "lifelong learning"],
-        "challenges": ["curriculum design", "assessment methods", "technology integration", "clinical exposure", "competency validation"],
-        "applications": ["medical school", "residency training", "continuing education", "simulation centers", "online learning"]
+        "core_concepts": ("clinical training", "medical knowledge", "competency development", "simulation", "continuing education"),
+        "techniques": ("case-based learning", "simulation training", "clinical rotations", "competency assessment", "peer learning"),
+        "metaphors": ("apprenticeship", "mastery", "development", "practice", "expertise", "lifelong learning"),
+        "challenges": ("curriculum design", "assessment methods", "technology integration", "clinical exposure", "competency validation"),
+        "applications": ("medical school", "residency training", "continuing education", "simulation centers", "online learning")
     },
     "patient care": {
-        "core_concepts": ["patient-centered care", "care coordination", "quality outcomes", "patient safety", "care delivery"],
-        "techniques": ["care planning", "multidisciplinary teams", "patient engagement", "quality improvement", "care transitions"],
-        "metaphors": ["healing", "compassion", "partnership", "support", "guidance", "recovery"],
-        "challenges": ["care coordination", "patient compliance", "resource constraints", "quality measurement", "patient satisfaction"],
-        "applications": ["hospital care", "primary care", "specialty care", "home healthcare", "palliative care"]
+        "core_concepts": ("patient-centered care", "care coordination", "quality outcomes", "patient safety", "care delivery"),
+        "techniques": ("care planning", "multidisciplinary teams", "patient engagement", "quality improvement", "care transitions"),
+        "metaphors": ("healing", "compassion", "partnership", "support", "guidance", "recovery"),
+        "challenges": ("care coordination", "patient compliance", "resource constraints", "quality measurement", "patient satisfaction"),
+        "applications": ("hospital care", "primary care", "specialty care", "home healthcare", "palliative care")
     },
 
     # Education & Learning
     "educational technology": {
-        "core_concepts": ["digital learning", "educational software", "learning management systems", "adaptive learning", "educational content"],
-        "techniques": ["instructional design", "learning analytics", "gamification", "personalized learning", "assessment technology"],
-        "metaphors": ["empowerment", "transformation", "discovery", "growth", "exploration", "innovation"],
-        "challenges": ["digital divide", "teacher training", "content quality", "student engagement", "technology integration"],
-        "applications": ["LMS platforms", "educational apps", "online courses", "virtual classrooms", "assessment tools"]
+        "core_concepts": ("digital learning", "educational software", "learning management systems", "adaptive learning", "educational content"),
+        "techniques": ("instructional design", "learning analytics", "gamification", "personalized learning", "assessment technology"),
+        "metaphors": ("empowerment", "transformation", "discovery", "growth", "exploration", "innovation"),
+        "challenges": ("digital divide", "teacher training", "content quality", "student engagement", "technology integration"),
+        "applications": ("LMS platforms", "educational apps", "online courses", "virtual classrooms", "assessment tools")
     },
     "online learning": {
-        "core_concepts": ["distance education", "virtual classrooms", "self-paced learning", "digital content", "remote instruction"],
-        "techniques": ["video lectures", "interactive content", "discussion forums", "virtual labs", "online assessment"],
-        "metaphors": ["accessibility", "flexibility", "connection", "reach", "opportunity", "democratization"],
-        "challenges": ["student engagement", "technical barriers", "quality assurance", "social interaction", "assessment integrity"],
-        "applications": ["MOOCs", "corporate training", "K-12 education", "higher education", "professional development"]
+        "core_concepts": ("distance education", "virtual classrooms", "self-paced learning", "digital content", "remote instruction"),
+        "techniques": ("video lectures", "interactive content", "discussion forums", "virtual labs", "online assessment"),
+        "metaphors": ("accessibility", "flexibility", "connection", "reach", "opportunity", "democratization"),
+        "challenges": ("student engagement", "technical barriers", "quality assurance", "social interaction", "assessment integrity"),
+        "applications": ("MOOCs", "corporate training", "K-12 education", "higher education", "professional development")
     },
     "curriculum development": {
-        "core_concepts": ["learning objectives", "instructional design", "assessment strategies", "content sequencing", "competency mapping"],
-        "techniques": ["backward design", "standards alignment", "learning outcome mapping", "assessment design", "content curation"],
-        "metaphors": ["blueprint", "journey", "scaffolding", "progression", "development", "structure"],
-        "challenges": ["standards alignment", "content relevance", "assessment validity", "implementation", "continuous improvement"],
-        "applications": ["K-12 curriculum", "higher education", "corporate training", "professional certification", "skill development"]
+        "core_concepts": ("learning objectives", "instructional design", "assessment strategies", "content sequencing", "competency mapping"),
+        "techniques": ("backward design", "standards alignment", "learning outcome mapping", "assessment design", "content curation"),
+        "metaphors": ("blueprint", "journey", "scaffolding", "progression", "development", "structure"),
+        "challenges": ("standards alignment", "content relevance", "assessment validity", "implementation", "continuous improvement"),
+        "applications": ("K-12 curriculum", "higher education", "corporate training", "professional certification", "skill development")
     },
     "teacher training": {
-        "core_concepts": ["pedagogical skills", "classroom management", "instructional strategies", "professional development", "educational theory"],
-        "techniques": ["mentoring", "peer observation", "reflective practice", "action research", "collaborative learning"],
-        "metaphors": ["growth", "mastery", "development", "empowerment", "transformation", "expertise"],
-        "challenges": ["time constraints", "resource limitations", "technology integration", "diverse learners", "assessment methods"],
-        "applications": ["pre-service training", "in-service development", "leadership training", "subject-specific training", "technology training"]
+        "core_concepts": ("pedagogical skills", "classroom management", "instructional strategies", "professional development", "educational theory"),
+        "techniques": ("mentoring", "peer observation", "reflective practice", "action research", "collaborative learning"),
+        "metaphors": ("growth", "mastery", "development", "empowerment", "transformation", "expertise"),
+        "challenges": ("time constraints", "resource limitations", "technology integration", "diverse learners", "assessment methods"),
+        "applications": ("pre-service training", "in-service development", "leadership training", "subject-specific training", "technology training")
     },
     "student engagement": {
-        "core_concepts": ["active learning", "motivation", "participation", "learning experience", "student-centered learning"],
-        "techniques": ["gamification", "interactive activities", "collaborative learning", "project-based learning", "peer learning"],
-        "metaphors": ["spark", "connection", "involvement", "participation", "energy", "enthusiasm"],
-        "challenges": ["attention span", "diverse learning styles", "technology distractions", "motivation", "assessment"],
-        "applications": ["classroom activities", "online learning", "educational games", "interactive content", "learning platforms"]
+        "core_concepts": ("active learning", "motivation", "participation", "learning experience", "student-centered learning"),
+        "techniques": ("gamification", "interactive activities", "collaborative learning", "project-based learning", "peer learning"),
+        "metaphors": ("spark", "connection", "involvement", "participation", "energy", "enthusiasm"),
+        "challenges": ("attention span", "diverse learning styles", "technology distractions", "motivation", "assessment"),
+        "applications": ("classroom activities", "online learning", "educational games", "interactive content", "learning platforms")
     },
     "learning analytics": {
-        "core_concepts": ["educational data", "learning patterns", "performance tracking", "predictive modeling", "personalized learning"],
-        "techniques": ["data mining", "statistical analysis", "visualization", "machine learning", "dashboard development"],
-        "metaphors": ["insight", "intelligence", "understanding", "discovery", "optimization", "guidance"],
-        "challenges": ["data privacy", "interpretation", "actionable insights", "system integration", "teacher training"],
-        "applications": ["LMS analytics", "student performance tracking", "early warning systems", "personalized recommendations"]
+        "core_concepts": ("educational data", "learning patterns", "performance tracking", "predictive modeling", "personalized learning"),
+        "techniques": ("data mining", "statistical analysis", "visualization", "machine learning", "dashboard development"),
+        "metaphors": ("insight", "intelligence", "understanding", "discovery", "optimization", "guidance"),
+        "challenges": ("data privacy", "interpretation", "actionable insights", "system integration", "teacher training"),
+        "applications": ("LMS analytics", "student performance tracking", "early warning systems", "personalized recommendations")
     },
     "educational games": {
-        "core_concepts": ["game-based learning", "educational content", "engagement", "skill development", "assessment"],
-        "techniques": ["game design", "narrative development", "progression systems", "feedback mechanisms", "assessment integration"],
-        "metaphors": ["play", "adventure", "challenge", "discovery", "achievement", "exploration"],
-        "challenges": ["educational effectiveness", "content alignment", "engagement sustainability", "assessment validity"],
-        "applications": ["serious games", "simulation games", "skill training", "language learning", "STEM education"]
+        "core_concepts": ("game-based learning", "educational content", "engagement", "skill development", "assessment"),
+        "techniques": ("game design", "narrative development", "progression systems", "feedback mechanisms", "assessment integration"),
+        "metaphors": ("play", "adventure", "challenge", "discovery", "achievement", "exploration"),
+        "challenges": ("educational effectiveness", "content alignment", "engagement sustainability", "assessment validity"),
+        "applications": ("serious games", "simulation games", "skill training", "language learning", "STEM education")
     },
     "skill development": {
-        "core_concepts": ["competency building", "practical skills", "professional development", "lifelong learning", "capability enhancement"],
-        "techniques": ["hands-on training", "mentorship", "practice sessions", "skill assessment", "progressive learning"],
-        "metaphors": ["growth", "building", "craftsmanship", "mastery", "development", "enhancement"],
-        "challenges": ["skill relevance", "transfer to practice", "assessment methods", "motivation", "resource availability"],
-        "applications": ["vocational training", "professional development", "technical skills", "soft skills", "certification programs"]
+        "core_concepts": ("competency building", "practical skills", "professional development", "lifelong learning", "capability enhancement"),
+        "techniques": ("hands-on training", "mentorship", "practice sessions", "skill assessment", "progressive learning"),
+        "metaphors": ("growth", "building", "craftsmanship", "mastery", "development", "enhancement"),
+        "challenges": ("skill relevance", "transfer to practice", "assessment methods", "motivation", "resource availability"),
+        "applications": ("vocational training", "professional development", "technical skills", "soft skills", "certification programs")
     },
 
     # Environment & Sustainability
     "renewable energy": {
-        "core_concepts": ["solar power", "wind energy", "hydroelectric", "geothermal", "biomass", "energy storage"],
-        "techniques": ["energy conversion", "grid integration", "energy storage", "efficiency optimization", "lifecycle assessment"],
-        "metaphors": ["harvest", "capture", "transformation", "sustainability", "clean power", "natural resources"],
-        "challenges": ["intermittency", "storage", "cost competitiveness", "grid integration", "policy support"],
-        "applications": ["solar installations", "wind farms", "energy storage systems", "smart grids", "distributed energy"]
+        "core_concepts": ("solar power", "wind energy", "hydroelectric", "geothermal", "biomass", "energy storage"),
+        "techniques": ("energy conversion", "grid integration", "energy storage", "efficiency optimization", "lifecycle assessment"),
+        "metaphors": ("harvest", "capture", "transformation", "sustainability", "clean power", "natural resources"),
+        "challenges": ("intermittency", "storage", "cost competitiveness", "grid integration", "policy support"),
+        "applications": ("solar installations", "wind farms", "energy storage systems", "smart grids", "distributed energy")
     },
     "sustainable agriculture": {
-        "core_concepts": ["organic farming", "soil health", "biodiversity", "water conservation", "crop rotation", "ecosystem balance"],
-        "techniques": ["precision farming", "integrated pest management", "cover cropping", "composting", "water-efficient irrigation"],
-        "metaphors": ["cultivation", "stewardship", "harmony", "balance", "regeneration", "nurturing"],
-        "challenges": ["yield optimization", "pest management", "climate adaptation", "market access", "certification"],
-        "applications": ["organic farming", "permaculture", "vertical farming", "precision agriculture", "sustainable livestock"]
+        "core_concepts": ("organic farming", "soil health", "biodiversity", "water conservation", "crop rotation", "ecosystem balance"),
+        "techniques": ("precision farming", "integrated pest management", "cover cropping", "composting", "water-efficient irrigation"),
+        "metaphors": ("cultivation", "stewardship", "harmony", "balance", "regeneration", "nurturing"),
+        "challenges": ("yield optimization", "pest management", "climate adaptation", "market access", "certification"),
+        "applications": ("organic farming", "permaculture", "vertical farming", "precision agriculture", "sustainable livestock")
     },
     "environmental conservation": {
-        "core_concepts": ["biodiversity protection", "habitat preservation", "species conservation", "ecosystem restoration", "sustainability"],
-        "techniques": ["habitat restoration", "species monitoring", "conservation planning", "community engagement", "policy advocacy"],
-        "metaphors": ["protection", "preservation", "stewardship", "guardianship", "restoration", "balance"],
-        "challenges": ["habitat loss", "climate change", "human-wildlife conflict", "funding", "policy implementation"],
-        "applications": ["wildlife conservation", "marine protection", "forest conservation", "wetland restoration", "urban conservation"]
+        "core_concepts": ("biodiversity protection", "habitat preservation", "species conservation", "ecosystem restoration", "sustainability"),
+        "techniques": ("habitat restoration", "species monitoring", "conservation planning", "community engagement", "policy advocacy"),
+        "metaphors": ("protection", "preservation", "stewardship", "guardianship", "restoration", "balance"),
+        "challenges": ("habitat loss", "climate change", "human-wildlife conflict", "funding", "policy implementation"),
+        "applications": ("wildlife conservation", "marine protection", "forest conservation", "wetland restoration", "urban conservation")
     },
     "green technology": {
-        "core_concepts": ["clean technology", "environmental innovation", "sustainable solutions", "eco-friendly design", "circular economy"],
-        "techniques": ["lifecycle assessment", "eco-design", "material selection", "energy efficiency", "waste reduction"],
-        "metaphors": ["innovation", "transformation", "sustainability", "harmony", "efficiency", "responsibility"],
-        "challenges": ["cost competitiveness", "market adoption", "scalability", "regulatory approval", "consumer acceptance"],
-        "applications": ["clean energy", "waste management", "water treatment", "sustainable materials", "green building"]
+        "core_concepts": ("clean technology", "environmental innovation", "sustainable solutions", "eco-friendly design", "circular economy"),
+        "techniques": ("lifecycle assessment", "eco-design", "material selection", "energy efficiency", "waste reduction"),
+        "metaphors": ("innovation", "transformation", "sustainability", "harmony", "efficiency", "responsibility"),
+        "challenges": ("cost competitiveness", "market adoption", "scalability", "regulatory approval", "consumer acceptance"),
+        "applications": ("clean energy", "waste management", "water treatment", "sustainable materials", "green building")
     },
     "waste management": {
-        "core_concepts": ["waste reduction", "recycling", "circular economy", "waste-to-energy", "sustainable disposal"],
-        "techniques": ["source reduction", "material recovery", "composting", "anaerobic digestion", "waste sorting"],
-        "metaphors": ["transformation", "recovery", "renewal", "efficiency", "responsibility", "stewardship"],
-        "challenges": ["contamination", "cost effectiveness", "behavior change", "infrastructure", "regulation"],
-        "applications": ["municipal waste", "industrial waste", "electronic waste", "organic waste", "hazardous waste"]
+        "core_concepts": ("waste reduction", "recycling", "circular economy", "waste-to-energy", "sustainable disposal"),
+        "techniques": ("source reduction", "material recovery", "composting", "anaerobic digestion", "waste sorting"),
+        "metaphors": ("transformation", "recovery", "renewal", "efficiency", "responsibility", "stewardship"),
+        "challenges": ("contamination", "cost effectiveness", "behavior change", "infrastructure", "regulation"),
+        "applications": ("municipal waste", "industrial waste", "electronic waste", "organic waste", "hazardous waste")
     },
     "climate solutions": {
-        "core_concepts": ["carbon reduction", "climate adaptation", "mitigation strategies", "resilience building", "sustainability"],
-        "techniques": ["carbon capture", "emission reduction", "adaptation planning", "resilience assessment", "policy development"],
-        "metaphors": ["healing", "protection", "adaptation", "resilience", "transformation", "stewardship"],
-        "challenges": ["scale of impact", "cost", "political will", "technology readiness", "global coordination"],
-        "applications": ["carbon capture", "renewable energy", "climate adaptation", "sustainable transport", "green buildings"]
+        "core_concepts": ("carbon reduction", "climate adaptation", "mitigation strategies", "resilience building", "sustainability"),
+        "techniques": ("carbon capture", "emission reduction", "adaptation planning", "resilience assessment", "policy development"),
+        "metaphors": ("healing", "protection", "adaptation", "resilience", "transformation", "stewardship"),
+        "challenges": ("scale of impact", "cost", "political will", "technology readiness", "global coordination"),
+        "applications": ("carbon capture", "renewable energy", "climate adaptation", "sustainable transport", "green buildings")
     },
     "eco-friendly products": {
-        "core_concepts": ["sustainable materials", "biodegradable", "non-toxic", "energy efficient", "minimal packaging"],
-        "techniques": ["sustainable design", "material selection", "lifecycle assessment", "eco-labeling", "green chemistry"],
-        "metaphors": ["harmony", "responsibility", "care", "sustainability", "mindfulness", "stewardship"],
-        "challenges": ["cost premium", "performance", "consumer acceptance", "certification", "supply chain"],
-        "applications": ["consumer goods", "packaging", "textiles", "cosmetics", "cleaning products"]
+        "core_concepts": ("sustainable materials", "biodegradable", "non-toxic", "energy efficient", "minimal packaging"),
+        "techniques": ("sustainable design", "material selection", "lifecycle assessment", "eco-labeling", "green chemistry"),
+        "metaphors": ("harmony", "responsibility", "care", "sustainability", "mindfulness", "stewardship"),
+        "challenges": ("cost premium", "performance", "consumer acceptance", "certification", "supply chain"),
+        "applications": ("consumer goods", "packaging", "textiles", "cosmetics", "cleaning products")
     },
     "carbon reduction": {
-        "core_concepts": ["emission reduction", "carbon footprint", "net zero", "carbon neutrality", "decarbonization"],
-        "techniques": ["emission measurement", "reduction strategies", "offset programs", "renewable energy", "efficiency improvements"],
-        "metaphors": ["reduction", "neutrality", "balance", "responsibility", "transformation", "commitment"],
-        "challenges": ["measurement accuracy", "cost", "technology availability", "behavior change", "policy support"],
-        "applications": ["corporate sustainability", "carbon markets", "renewable energy", "energy efficiency", "transportation"]
+        "core_concepts": ("emission reduction", "carbon footprint", "net zero", "carbon neutrality", "decarbonization"),
+        "techniques": ("emission measurement", "reduction strategies", "offset programs", "renewable energy", "efficiency improvements"),
+        "metaphors": ("reduction", "neutrality", "balance", "responsibility", "transformation", "commitment"),
+        "challenges": ("measurement accuracy", "cost", "technology availability", "behavior change", "policy support"),
+        "applications": ("corporate sustainability", "carbon markets", "renewable energy", "energy efficiency", "transportation")
     },
 
     # Transportation & Mobility
     "urban transportation": {
-        "core_concepts": ["public transit", "mobility solutions", "traffic management", "sustainable transport", "accessibility"],
-        "techniques": ["route optimization", "demand forecasting", "multimodal integration", "smart traffic systems", "accessibility design"],
-        "metaphors": ["flow", "network", "connectivity", "movement", "accessibility", "efficiency"],
-        "challenges": ["congestion", "funding", "infrastructure", "user adoption", "integration"],
-        "applications": ["bus systems", "rail transit", "bike sharing", "ride sharing", "pedestrian infrastructure"]
+        "core_concepts": ("public transit", "mobility solutions", "traffic management", "sustainable transport", "accessibility"),
+        "techniques": ("route optimization", "demand forecasting", "multimodal integration", "smart traffic systems", "accessibility design"),
+        "metaphors": ("flow", "network", "connectivity", "movement", "accessibility", "efficiency"),
+        "challenges": ("congestion", "funding", "infrastructure", "user adoption", "integration"),
+        "applications": ("bus systems", "rail transit", "bike sharing", "ride sharing", "pedestrian infrastructure")
     },
     "electric vehicles": {
-        "core_concepts": ["battery technology", "charging infrastructure", "energy efficiency", "emission reduction", "sustainable mobility"],
-        "techniques": ["battery management", "charging optimization", "range extension", "grid integration", "lifecycle assessment"],
-        "metaphors": ["transformation", "clean energy", "efficiency", "innovation", "sustainability"],
-        "challenges": ["battery cost", "charging infrastructure", "range anxiety", "grid impact", "material sourcing"],
-        "applications": ["passenger vehicles", "commercial vehicles", "public transport", "delivery vehicles", "micro-mobility"]
+        "core_concepts": ("battery technology", "charging infrastructure", "energy efficiency", "emission reduction", "sustainable mobility"),
+        "techniques": ("battery management", "charging optimization", "range extension", "grid integration", "lifecycle assessment"),
+        "metaphors": ("transformation", "clean energy", "efficiency", "innovation", "sustainability"),
+        "challenges": ("battery cost", "charging infrastructure", "range anxiety", "grid impact", "material sourcing"),
+        "applications": ("passenger vehicles", "commercial vehicles", "public transport", "delivery vehicles", "micro-mobility")
     },
     "autonomous vehicles": {
-        "core_concepts": ["self-driving", "artificial intelligence", "sensor technology", "safety systems", "traffic optimization"],
-        "techniques": ["machine learning", "sensor fusion", "path planning", "safety validation", "human-machine interaction"],
-        "metaphors": ["intelligence", "automation", "safety", "efficiency", "transformation", "evolution"],
-        "challenges": ["safety validation", "regulatory approval", "public acceptance", "ethical decisions", "infrastructure"],
-        "applications": ["passenger cars", "commercial vehicles", "public transport", "delivery systems", "mobility services"]
+        "core_concepts": ("self-driving", "artificial intelligence", "sensor technology", "safety systems", "traffic optimization"),
+        "techniques": ("machine learning", "sensor fusion", "path planning", "safety validation", "human-machine interaction"),
+        "metaphors": ("intelligence", "automation", "safety", "efficiency", "transformation", "evolution"),
+        "challenges": ("safety validation", "regulatory approval", "public acceptance", "ethical decisions", "infrastructure"),
+        "applications": ("passenger cars", "commercial vehicles", "public transport", "delivery systems", "mobility services")
     },
 
     # For brevity, I'll add a few more key domains and close the dictionary
     # This covers the most important domains for creativity enhancement
     "general innovation": {
-        "core_concepts": ["creativity", "problem solving", "ideation", "innovation process", "breakthrough thinking"],
-        "techniques": ["brainstorming", "design thinking", "lateral thinking", "systematic innovation", "creative problem solving"],
-        "metaphors": ["discovery", "breakthrough", "transformation", "creation", "evolution", "inspiration"],
-        "challenges": ["idea generation", "implementation", "resource constraints", "risk management", "market acceptance"],
-        "applications": ["product development", "process improvement", "service innovation", "business model innovation", "social innovation"]
+        "core_concepts": ("creativity", "problem solving", "ideation", "innovation process", "breakthrough thinking"),
+        "techniques": ("brainstorming", "design thinking", "lateral thinking", "systematic innovation", "creative problem solving"),
+        "metaphors": ("discovery", "breakthrough", "transformation", "creation", "evolution", "inspiration"),
+        "challenges": ("idea generation", "implementation", "resource constraints", "risk management", "market acceptance"),
+        "applications": ("product development", "process improvement", "service innovation", "business model innovation", "social innovation")
     }
-}
\ No newline at end of file
+})
+
+# Domain-specific analogy sources, keyed by domain then analogy category
+DOMAIN_ANALOGIES: Dict[str, Dict[str, Tuple[str, ...]]] = _intern_strings({
+    "artificial intelligence": {
+        "biological_systems": ("neural networks", "immune systems", "evolutionary processes", "swarm behavior", "brain plasticity"),
+        "cognitive_processes": ("learning patterns", "memory formation", "pattern recognition", "decision making", "problem solving"),
+        "mathematical_concepts": ("optimization algorithms", "statistical inference", "graph theory", "probability models", "linear algebra")
+    },
+    "healthcare technology": {
+        "biological_systems": ("immune response", "healing processes", "diagnostic mechanisms", "homeostasis", "cellular repair"),
+        "engineering_systems": ("monitoring systems", "feedback loops", "quality control", "system integration", "fault detection"),
+        "communication_systems": ("information networks", "signal processing", "data transmission", "protocol standards", "error correction")
+    },
+    "sustainable agriculture": {
+        "natural_ecosystems": ("nutrient cycling", "biodiversity", "symbiotic relationships", "succession patterns", "resource efficiency"),
+        "engineering_systems": ("closed-loop systems", "resource optimization", "automation", "sensor networks", "precision control"),
+        "economic_systems": ("supply chains", "market dynamics", "resource allocation", "risk management", "value creation")
+    },
+    "cybersecurity": {
+        "military_defense": ("perimeter defense", "intelligence gathering", "threat assessment", "strategic planning", "rapid response"),
+        "biological_immunity": ("pathogen detection", "immune response", "memory cells", "adaptive immunity", "barrier protection"),
+        "physical_security": ("access control", "surveillance systems", "alarm systems", "security protocols", "incident response")
+    },
+    "product design": {
+        "natural_forms": ("biomimetic structures", "efficient shapes", "adaptive mechanisms", "material properties", "functional aesthetics"),
+        "architectural_principles": ("form follows function", "structural integrity", "space utilization", "user flow", "environmental integration"),
+        "artistic_composition": ("visual balance", "proportion", "harmony", "contrast", "focal points")
+    },
+    "business strategy": {
+        "military_strategy": ("competitive intelligence", "strategic positioning", "resource allocation", "tactical execution", "alliance building"),
+        "game_theory": ("strategic moves", "competitive dynamics", "win-win scenarios", "risk assessment", "decision trees"),
+        "ecosystem_dynamics": ("competitive advantage", "niche specialization", "resource competition", "adaptation", "survival strategies")
+    },
+    "renewable energy": {
+        "natural_processes": ("photosynthesis", "wind patterns", "water cycles", "geothermal processes", "tidal forces"),
+        "energy_conversion": ("mechanical systems", "electrical generation", "energy storage", "power distribution", "efficiency optimization"),
+        "economic_models": ("resource economics", "investment strategies", "market dynamics", "cost optimization", "value creation")
+    },
+    "educational technology": {
+        "cognitive_science": ("learning theories", "memory formation", "attention mechanisms", "motivation psychology", "skill acquisition"),
+        "communication_systems": ("information delivery", "feedback loops", "interactive dialogue", "content adaptation", "user engagement"),
+        "game_design": ("progression systems", "reward mechanisms", "challenge scaling", "user engagement", "achievement systems")
+    }
+})
+
+# Domain-specific biomimicry examples with organism, mechanism, and property
+DOMAIN_BIOMIMICRY: Dict[str, Tuple[BiomimicryExample, ...]] = _intern_strings({
+    "artificial intelligence": (
+        BiomimicryExample("neural networks", "parallel information processing like brain neurons", "distributed intelligence"),
+        BiomimicryExample("ant colonies", "swarm optimization for collective problem solving", "emergent intelligence"),
+        BiomimicryExample("immune system", "pattern recognition and adaptive memory", "learning from experience"),
+        BiomimicryExample("octopus camouflage", "real-time pattern adaptation", "dynamic response systems"),
+        BiomimicryExample("bird flocking", "simple rules creating complex behavior", "emergent coordination")
+    ),
+    "renewable energy": (
+        BiomimicryExample("photosynthesis", "converts sunlight to chemical energy efficiently", "solar energy conversion"),
+        BiomimicryExample("wind dispersal seeds", "captures air currents for movement", "wind energy harvesting"),
+        BiomimicryExample("thermoregulation", "maintains optimal temperature with minimal energy", "energy conservation"),
+        BiomimicryExample("bioluminescence", "produces light through chemical reactions", "efficient light generation"),
+        BiomimicryExample("leaf structure", "maximizes surface area for energy capture", "energy collection optimization")
+    ),
+    "healthcare technology": (
+        BiomimicryExample("immune system", "detects and responds to threats automatically", "automated health monitoring"),
+        BiomimicryExample("blood clotting", "self-healing response to injury", "rapid repair mechanisms"),
+        BiomimicryExample("echolocation", "uses sound waves for internal imaging", "non-invasive diagnostics"),
+        BiomimicryExample("spider silk", "combines strength and flexibility", "biocompatible materials"),
+        BiomimicryExample("cellular repair", "targeted healing at microscopic level", "precision medicine")
+    ),
+    "cybersecurity": (
+        BiomimicryExample("immune system", "distinguishes self from non-self", "threat identification"),
+        BiomimicryExample("herd immunity", "collective protection through individual immunity", "network security"),
+        BiomimicryExample("camouflage", "blends with environment to avoid detection", "stealth protection"),
+        BiomimicryExample("warning signals", "alerts others to danger", "threat communication"),
+        BiomimicryExample("territorial behavior", "defends boundaries from intruders", "perimeter defense")
+    ),
+    "product design": (
+        BiomimicryExample("honeycomb structure", "maximizes storage with minimal material", "structural efficiency"),
+        BiomimicryExample("gecko feet", "reversible adhesion without chemicals", "smart attachment"),
+        BiomimicryExample("bird wing design", "optimized shape for efficient movement", "aerodynamic efficiency"),
+        BiomimicryExample("cactus spines", "collects water from air", "resource harvesting"),
+        BiomimicryExample("butterfly wings", "creates colors through structure not pigment", "sustainable aesthetics")
+    ),
+    "sustainable agriculture": (
+        BiomimicryExample("mycorrhizal networks", "fungi connect plant roots for nutrient sharing", "resource distribution"),
+        BiomimicryExample("nitrogen fixation", "bacteria convert atmospheric nitrogen to plant nutrients", "natural fertilization"),
+        BiomimicryExample("companion planting", "different plants support each other's growth", "symbiotic relationships"),
+        BiomimicryExample("forest succession", "gradual ecosystem development over time", "sustainable regeneration"),
+        BiomimicryExample("pollinator networks", "insects facilitate plant reproduction", "ecosystem services")
+    ),
+    "urban transportation": (
+        BiomimicryExample("ant trails", "optimizes paths through pheromone feedback", "traffic flow optimization"),
+        BiomimicryExample("bird migration", "efficient long-distance travel in groups", "coordinated movement"),
+        BiomimicryExample("slime mold networks", "finds shortest paths between resources", "route optimization"),
+        BiomimicryExample("schooling fish", "reduces energy through coordinated swimming", "collective efficiency"),
+        BiomimicryExample("honeybee waggle dance", "communicates location information", "navigation systems")
+    ),
+    "business strategy": (
+        BiomimicryExample("ecosystem dynamics", "species adapt to fill available niches", "market positioning"),
+        BiomimicryExample("predator-prey cycles", "populations balance through feedback loops", "competitive dynamics"),
+        BiomimicryExample("symbiotic relationships", "mutual benefit through cooperation", "strategic partnerships"),
+        BiomimicryExample("territorial behavior", "defends resources from competitors", "market protection"),
+        BiomimicryExample("migration patterns", "moves to exploit seasonal opportunities", "market timing")
+    )
+})
+
+# Domain-specific Six Thinking Hats prompts, keyed by domain then hat
+DOMAIN_PERSPECTIVES: Dict[str, Dict[str, Tuple[str, ...]]] = _intern_strings({
+    "artificial intelligence": {
+        "factual": (
+            "What AI performance metrics validate this approach?",
+            "What training data requirements exist?",
+            "What computational resources are needed?",
+            "What accuracy benchmarks apply?"
+        ),
+        "emotional": (
+            "How do users feel about AI making this decision?",
+            "What trust concerns arise with this AI system?",
+            "How does this impact human-AI interaction?",
+            "What ethical concerns do stakeholders have?"
+        ),
+        "critical": (
+            "What bias risks exist in this AI system?",
+            "How could this AI system fail or be misused?",
+            "What privacy concerns arise?",
+            "What happens when the AI encounters edge cases?"
+        ),
+        "positive": (
+            "How could this AI system improve decision-making?",
+            "What efficiency gains are possible?",
+            "How could this democratize AI capabilities?",
+            "What new possibilities does this AI enable?"
+        )
+    },
+    "healthcare technology": {
+        "factual": (
+            "What clinical evidence supports this approach?",
+            "What regulatory approvals are required?",
+            "What patient safety data exists?",
+            "What cost-effectiveness studies apply?"
+        ),
+        "emotional": (
+            "How do patients feel about this technology?",
+            "What concerns do healthcare providers have?",
+            "How does this impact patient-provider relationships?",
+            "What anxiety or comfort does this create?"
+        ),
+        "critical": (
+            "What patient safety risks exist?",
+            "How could this technology fail in critical situations?",
+            "What privacy concerns arise with health data?",
+            "What happens if the technology malfunctions?"
+        ),
+        "positive": (
+            "How could this improve patient outcomes?",
+            "What healthcare access benefits are possible?",
+            "How could this reduce healthcare costs?",
+            "What quality of life improvements result?"
+        )
+    },
+    "cybersecurity": {
+        "factual": (
+            "What threat vectors does this address?",
+            "What security standards does this meet?",
+            "What attack success rates exist?",
+            "What compliance requirements apply?"
+        ),
+        "emotional": (
+            "How do users feel about security vs. convenience?",
+            "What privacy concerns do stakeholders have?",
+            "How does this impact user trust?",
+            "What fear or confidence does this create?"
+        ),
+        "critical": (
+            "What new attack vectors could this create?",
+            "How could this security measure be bypassed?",
+            "What happens if this security system fails?",
+            "What false positive/negative risks exist?"
+        ),
+        "positive": (
+            "How could this improve overall security posture?",
+            "What threat prevention benefits are possible?",
+            "How could this reduce security incidents?",
+            "What peace of mind does this provide?"
+        )
+    },
+    "sustainable agriculture": {
+        "factual": (
+            "What yield data supports this approach?",
+            "What environmental impact measurements exist?",
+            "What cost-benefit analysis applies?",
+            "What soil health indicators are relevant?"
+        ),
+        "emotional": (
+            "How do farmers feel about adopting this practice?",
+            "What concerns do consumers have?",
+            "How does this impact farming communities?",
+            "What pride or worry does this create?"
+        ),
+        "critical": (
+            "What environmental risks could arise?",
+            "How could this approach fail in different climates?",
+            "What economic risks do farmers face?",
+            "What unintended consequences are possible?"
+        ),
+        "positive": (
+            "How could this improve soil health?",
+            "What biodiversity benefits are possible?",
+            "How could this reduce environmental impact?",
+            "What long-term sustainability gains result?"
+        )
+    }
+})
+
+# The pool is only needed while the tables above are built; release its
+# references now that every table holds the shared tuples itself
+_TUPLE_POOL.clear()
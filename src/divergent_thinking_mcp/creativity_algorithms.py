@@ -7,7 +7,9 @@ to enhance divergent thinking and idea generation capabilities.
 
 import random
 import logging
-from typing import List, Dict, Optional, Any
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
@@ -15,12 +17,117 @@ from .constants import (
     RANDOM_WORDS,
     ANALOGICAL_DOMAINS,
     BIOMIMICRY_EXAMPLES,
-    DOMAIN_KEYWORDS,
     DOMAIN_CREATIVITY_WORDS,
+    DOMAIN_ANALOGIES,
+    DOMAIN_BIOMIMICRY,
+    DOMAIN_PERSPECTIVES,
+    BiomimicryExample,
+    Domain,
 )
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only fallback for domains without a dedicated word bank
+_EMPTY_WORD_BANK: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+
+# Shared read-only fallback for domains without dedicated Six Thinking Hats perspectives
+_EMPTY_PERSPECTIVES: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+
+# Flattened (domain, category) view of DOMAIN_CREATIVITY_WORDS so the common
+# single-category lookup is one dict probe instead of two
+_CREATIVITY_WORDS_BY_CATEGORY: Dict[Tuple[str, str], Tuple[str, ...]] = {
+    (domain, category): words
+    for domain, categories in DOMAIN_CREATIVITY_WORDS.items()
+    for category, words in categories.items()
+}
+
+# Every domain with at least one dedicated creativity table
+ALL_DOMAINS: FrozenSet[str] = frozenset(chain(
+    DOMAIN_ANALOGIES,
+    DOMAIN_BIOMIMICRY,
+    DOMAIN_PERSPECTIVES,
+    DOMAIN_CREATIVITY_WORDS,
+))
+
+
+def has_domain(domain: str) -> bool:
+    """
+    Check whether a domain has any dedicated creativity tables.
+
+    Args:
+        domain: Target domain for creativity
+
+    Returns:
+        bool: True if domain-specific data exists, False if generic fallbacks apply
+    """
+    return domain in ALL_DOMAINS
+
+
+def get_creativity_words(domain: str, category: str) -> Tuple[str, ...]:
+    """
+    Get the domain-specific word bank for a single category.
+
+    Args:
+        domain: Target domain for creativity
+        category: Word category (core_concepts, techniques, metaphors, challenges, applications)
+
+    Returns:
+        Tuple[str, ...]: Words for the category, or an empty tuple if none exist
+    """
+    return _CREATIVITY_WORDS_BY_CATEGORY.get((domain, category), ())
+
+
+def get_domain_analogies(domain: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    Get relevant analogy domains for the target domain.
+
+    Args:
+        domain: Target domain for creativity
+
+    Returns:
+        Dict[str, Tuple[str, ...]]: Mapping of analogy categories to examples
+    """
+    # Return domain-specific analogies or fall back to generic ones
+    return DOMAIN_ANALOGIES.get(domain, ANALOGICAL_DOMAINS)
+
+
+def get_domain_biomimicry(domain: str) -> Sequence[BiomimicryExample]:
+    """
+    Get domain-relevant biomimicry examples.
+
+    Args:
+        domain: Target domain for creativity
+
+    Returns:
+        Sequence[BiomimicryExample]: Biomimicry examples with organism, mechanism, and property
+    """
+    # Return domain-specific biomimicry examples or fall back to generic ones
+    return DOMAIN_BIOMIMICRY.get(domain, BIOMIMICRY_EXAMPLES)
+
+
+def get_domain_perspectives(domain: str) -> Mapping[str, Tuple[str, ...]]:
+    """
+    Get domain-specific perspectives for Six Thinking Hats.
+
+    Args:
+        domain: Target domain for creativity
+
+    Returns:
+        Mapping[str, Tuple[str, ...]]: Domain-specific prompts for each thinking hat
+    """
+    return DOMAIN_PERSPECTIVES.get(domain, _EMPTY_PERSPECTIVES)
+
+
+# Read-only dispatch table of the domain getters. Hot loops can bind the
+# function once, e.g. ``fn = LOOKUPS["analogies"]`` and then call ``fn(d)``
+# per domain, instead of resolving a module attribute on every iteration.
+LOOKUPS: Mapping[str, Callable[..., Any]] = MappingProxyType({
+    "analogies": get_domain_analogies,
+    "biomimicry": get_domain_biomimicry,
+    "perspectives": get_domain_perspectives,
+    "words": get_creativity_words,
+})
+
 
 class CreativityTechnique(Enum):
     """Enumeration of available creativity techniques."""
@@ -52,21 +159,19 @@ class CreativityAlgorithms:
     This class implements various creativity techniques and algorithms
     to generate innovative ideas and solutions.
     """
-    
-    def __init__(self):
-        self.random_words = RANDOM_WORDS
-        self.analogical_domains = ANALOGICAL_DOMAINS
-        self.biomimicry_examples = BIOMIMICRY_EXAMPLES
-        self.domain_keywords = DOMAIN_KEYWORDS
-        self.domain_creativity_words = DOMAIN_CREATIVITY_WORDS
-
-    def _safe_random_sample(self, items: List[Any], size: int) -> List[Any]:
+
+    # All data lives in module-level tables; instances carry no state
+    __slots__ = ()
+
+    def _safe_random_sample(self, items: Sequence[Any], size: int,
+                            rng: Optional[random.Random] = None) -> List[Any]:
         """
         Safely sample items, handling cases where list is smaller than requested size.
 
         Args:
-            items: List of items to sample from
+            items: Sequence of items to sample from
             size: Desired sample size
+            rng: Optional random generator (defaults to the shared module-level one)
 
         Returns:
             List[Any]: Sampled items (may be smaller than requested size if input is small)
@@ -74,10 +179,11 @@ class CreativityAlgorithms:
         if not items:
             return []
         actual_size = min(size, len(items))
-        return random.sample(items, actual_size)
+        return (rng or random).sample(items, actual_size)
 
     def _intelligent_word_selection(self, domain: str, context: Optional[CreativityContext] = None,
-                                   category: str = "core_concepts", count: int = 3) -> List[str]:
+                                   category: str = "core_concepts", count: int = 3,
+                                   rng: Optional[random.Random] = None) -> List[str]:
         """
         Intelligently select words based on domain and context.
 
@@ -91,41 +197,42 @@ class CreativityAlgorithms:
             context: Full creativity context (optional)
             category: Word category to select from (core_concepts, techniques, metaphors, challenges, applications)
             count: Number of words to select
+            rng: Optional random generator (defaults to the shared module-level one)
 
         Returns:
             List[str]: Contextually relevant words
         """
-        domain_words = self.domain_creativity_words.get(domain, {})
         selected_words = []
 
         # Priority 1: Domain-specific words from requested category
-        if category in domain_words:
-            available_words = domain_words[category]
+        available_words = get_creativity_words(domain, category)
+        if available_words:
             selected_count = min(count, len(available_words))
-            selected_words.extend(self._safe_random_sample(available_words, selected_count))
+            selected_words.extend(self._safe_random_sample(available_words, selected_count, rng))
 
         # Priority 2: Context-aware selection from other categories
         remaining_count = count - len(selected_words)
-        if remaining_count > 0 and context and domain_words:
+        if remaining_count > 0 and context:
             # If goals specified, add technique-related words
-            if context.goals and "techniques" in domain_words and category != "techniques":
-                technique_words = domain_words["techniques"]
+            if context.goals and category != "techniques":
+                technique_words = get_creativity_words(domain, "techniques")
                 technique_count = min(remaining_count // 2, len(technique_words))
                 if technique_count > 0:
-                    selected_words.extend(self._safe_random_sample(technique_words, technique_count))
+                    selected_words.extend(self._safe_random_sample(technique_words, technique_count, rng))
 
             # If constraints mentioned, add challenge-related words
             remaining_count = count - len(selected_words)
-            if remaining_count > 0 and context.constraints and "challenges" in domain_words and category != "challenges":
-                challenge_words = domain_words["challenges"]
+            if remaining_count > 0 and context.constraints and category != "challenges":
+                challenge_words = get_creativity_words(domain, "challenges")
                 challenge_count = min(remaining_count, len(challenge_words))
                 if challenge_count > 0:
-                    selected_words.extend(self._safe_random_sample(challenge_words, challenge_count))
+                    selected_words.extend(self._safe_random_sample(challenge_words, challenge_count, rng))
 
         # Priority 3: Fallback to generic words if still needed
         remaining_count = count - len(selected_words)
         if remaining_count > 0:
             # Try other categories from the same domain first
+            domain_words = DOMAIN_CREATIVITY_WORDS.get(domain, _EMPTY_WORD_BANK)
             if domain_words:
                 all_domain_words = []
                 for cat, words in domain_words.items():
@@ -134,22 +241,24 @@ class CreativityAlgorithms:
 
                 if all_domain_words:
                     fallback_count = min(remaining_count, len(all_domain_words))
-                    selected_words.extend(self._safe_random_sample(all_domain_words, fallback_count))
+                    selected_words.extend(self._safe_random_sample(all_domain_words, fallback_count, rng))
 
             # Final fallback to generic random words
             remaining_count = count - len(selected_words)
             if remaining_count > 0:
-                selected_words.extend(self._safe_random_sample(self.random_words, remaining_count))
+                selected_words.extend(self._safe_random_sample(RANDOM_WORDS, remaining_count, rng))
 
         return selected_words[:count]
 
-    def _select_contextual_prompt(self, prompts: List[str], context: Optional[CreativityContext] = None) -> str:
+    def _select_contextual_prompt(self, prompts: Sequence[str], context: Optional[CreativityContext] = None,
+                                  rng: Optional[random.Random] = None) -> str:
         """
         Select the most contextually appropriate prompt from a list.
 
         Args:
             prompts: List of available prompts
             context: Creativity context for selection
+            rng: Optional random generator (defaults to the shared module-level one)
 
         Returns:
             str: Selected prompt
@@ -158,30 +267,32 @@ class CreativityAlgorithms:
             return ""
 
         if not context:
-            return random.choice(prompts)
+            return (rng or random).choice(prompts)
 
         # Simple contextual selection - can be enhanced further
         # For now, just return a random choice, but this method provides
         # a hook for more sophisticated context-aware selection
-        return random.choice(prompts)
+        return (rng or random).choice(prompts)
     
-    def apply_scamper(self, idea: str, context: Optional[CreativityContext] = None) -> List[str]:
+    def apply_scamper(self, idea: str, context: Optional[CreativityContext] = None,
+                      rng: Optional[random.Random] = None) -> List[str]:
         """
         Apply SCAMPER technique with domain-aware prompts.
 
         Args:
             idea: The original idea to transform
             context: Optional context for more targeted suggestions
+            rng: Optional random generator for reproducible selection
 
         Returns:
             List[str]: List of SCAMPER-generated variations
         """
-        domain = context.domain if context else "general innovation"
+        domain = context.domain if context else Domain.GENERAL_INNOVATION
 
         # Get domain-relevant words for contextual prompts
-        domain_words = self._intelligent_word_selection(domain, context, "core_concepts", 5)
-        technique_words = self._intelligent_word_selection(domain, context, "techniques", 3)
-        application_words = self._intelligent_word_selection(domain, context, "applications", 3)
+        domain_words = self._intelligent_word_selection(domain, context, "core_concepts", 5, rng)
+        technique_words = self._intelligent_word_selection(domain, context, "techniques", 3, rng)
+        application_words = self._intelligent_word_selection(domain, context, "applications", 3, rng)
 
         scamper_prompts = {
             "Substitute": [
@@ -231,13 +342,14 @@ class CreativityAlgorithms:
         # Select most relevant prompts based on context
         results = []
         for category, prompts in scamper_prompts.items():
-            selected_prompt = self._select_contextual_prompt(prompts, context)
+            selected_prompt = self._select_contextual_prompt(prompts, context, rng)
             results.append(f"[{category}] {selected_prompt}")
 
         return results
     
     def generate_random_word_associations(self, idea: str, num_words: int = 3,
-                                         context: Optional[CreativityContext] = None) -> List[str]:
+                                         context: Optional[CreativityContext] = None,
+                                         rng: Optional[random.Random] = None) -> List[str]:
         """
         Generate ideas using domain-aware word association technique.
 
@@ -245,15 +357,16 @@ class CreativityAlgorithms:
             idea: The original idea
             num_words: Number of words to use for associations
             context: Optional context for domain-aware word selection
+            rng: Optional random generator for reproducible selection
 
         Returns:
             List[str]: List of domain-aware word association prompts
         """
-        domain = context.domain if context else "general innovation"
+        domain = context.domain if context else Domain.GENERAL_INNOVATION
 
         # Get domain-relevant words instead of purely random
-        domain_words = self._intelligent_word_selection(domain, context, "core_concepts", num_words // 2)
-        metaphor_words = self._intelligent_word_selection(domain, context, "metaphors", num_words // 2)
+        domain_words = self._intelligent_word_selection(domain, context, "core_concepts", num_words // 2, rng)
+        metaphor_words = self._intelligent_word_selection(domain, context, "metaphors", num_words // 2, rng)
 
         # Combine domain-specific and metaphorical words
         selected_words = domain_words + metaphor_words
@@ -262,13 +375,13 @@ class CreativityAlgorithms:
         if len(selected_words) < num_words:
             remaining = num_words - len(selected_words)
             # Try to get more from other categories
-            technique_words = self._intelligent_word_selection(domain, context, "techniques", remaining)
+            technique_words = self._intelligent_word_selection(domain, context, "techniques", remaining, rng)
             selected_words.extend(technique_words)
 
         # Final fallback to generic words if still needed
         if len(selected_words) < num_words:
             remaining = num_words - len(selected_words)
-            fallback_words = self._safe_random_sample(self.random_words, remaining)
+            fallback_words = self._safe_random_sample(RANDOM_WORDS, remaining, rng)
             selected_words.extend(fallback_words)
 
         prompts = []
@@ -282,64 +395,9 @@ class CreativityAlgorithms:
 
         return prompts
 
-    def _get_domain_analogies(self, domain: str) -> Dict[str, List[str]]:
-        """
-        Get relevant analogy domains for the target domain.
-
-        Args:
-            domain: Target domain for creativity
-
-        Returns:
-            Dict[str, List[str]]: Mapping of analogy categories to examples
-        """
-        domain_analogy_map = {
-            "artificial intelligence": {
-                "biological_systems": ["neural networks", "immune systems", "evolutionary processes", "swarm behavior", "brain plasticity"],
-                "cognitive_processes": ["learning patterns", "memory formation", "pattern recognition", "decision making", "problem solving"],
-                "mathematical_concepts": ["optimization algorithms", "statistical inference", "graph theory", "probability models", "linear algebra"]
-            },
-            "healthcare technology": {
-                "biological_systems": ["immune response", "healing processes", "diagnostic mechanisms", "homeostasis", "cellular repair"],
-                "engineering_systems": ["monitoring systems", "feedback loops", "quality control", "system integration", "fault detection"],
-                "communication_systems": ["information networks", "signal processing", "data transmission", "protocol standards", "error correction"]
-            },
-            "sustainable agriculture": {
-                "natural_ecosystems": ["nutrient cycling", "biodiversity", "symbiotic relationships", "succession patterns", "resource efficiency"],
-                "engineering_systems": ["closed-loop systems", "resource optimization", "automation", "sensor networks", "precision control"],
-                "economic_systems": ["supply chains", "market dynamics", "resource allocation", "risk management", "value creation"]
-            },
-            "cybersecurity": {
-                "military_defense": ["perimeter defense", "intelligence gathering", "threat assessment", "strategic planning", "rapid response"],
-                "biological_immunity": ["pathogen detection", "immune response", "memory cells", "adaptive immunity", "barrier protection"],
-                "physical_security": ["access control", "surveillance systems", "alarm systems", "security protocols", "incident response"]
-            },
-            "product design": {
-                "natural_forms": ["biomimetic structures", "efficient shapes", "adaptive mechanisms", "material properties", "functional aesthetics"],
-                "architectural_principles": ["form follows function", "structural integrity", "space utilization", "user flow", "environmental integration"],
-                "artistic_composition": ["visual balance", "proportion", "harmony", "contrast", "focal points"]
-            },
-            "business strategy": {
-                "military_strategy": ["competitive intelligence", "strategic positioning", "resource allocation", "tactical execution", "alliance building"],
-                "game_theory": ["strategic moves", "competitive dynamics", "win-win scenarios", "risk assessment", "decision trees"],
-                "ecosystem_dynamics": ["competitive advantage", "niche specialization", "resource competition", "adaptation", "survival strategies"]
-            },
-            "renewable energy": {
-                "natural_processes": ["photosynthesis", "wind patterns", "water cycles", "geothermal processes", "tidal forces"],
-                "energy_conversion": ["mechanical systems", "electrical generation", "energy storage", "power distribution", "efficiency optimization"],
-                "economic_models": ["resource economics", "investment strategies", "market dynamics", "cost optimization", "value creation"]
-            },
-            "educational technology": {
-                "cognitive_science": ["learning theories", "memory formation", "attention mechanisms", "motivation psychology", "skill acquisition"],
-                "communication_systems": ["information delivery", "feedback loops", "interactive dialogue", "content adaptation", "user engagement"],
-                "game_design": ["progression systems", "reward mechanisms", "challenge scaling", "user engagement", "achievement systems"]
-            }
-        }
-
-        # Return domain-specific analogies or fall back to generic ones
-        return domain_analogy_map.get(domain, self.analogical_domains)
-
     def apply_analogical_thinking(self, idea: str, domain: Optional[str] = None,
-                                 context: Optional[CreativityContext] = None) -> List[str]:
+                                 context: Optional[CreativityContext] = None,
+                                 rng: Optional[random.Random] = None) -> List[str]:
         """
         Apply analogical thinking with domain-relevant analogies.
 
@@ -347,19 +405,20 @@ class CreativityAlgorithms:
             idea: The original idea
             domain: Target domain for the idea (uses context.domain if not provided)
             context: Optional creativity context
+            rng: Optional random generator for reproducible selection
 
         Returns:
             List[str]: List of domain-aware analogical thinking prompts
         """
         # Use context domain if available, otherwise use provided domain or default
-        target_domain = domain or (context.domain if context else "general innovation")
+        target_domain = domain or (context.domain if context else Domain.GENERAL_INNOVATION)
 
         # Get domain-specific analogy sources
-        domain_analogies = self._get_domain_analogies(target_domain)
+        domain_analogies = get_domain_analogies(target_domain)
 
         prompts = []
         for analogy_category, examples in domain_analogies.items():
-            selected_examples = self._safe_random_sample(examples, 2)
+            selected_examples = self._safe_random_sample(examples, 2, rng)
             for example in selected_examples:
                 prompts.extend([
                     f"How is '{idea}' like {example} in {analogy_category}? What insights does this reveal for {target_domain}?",
@@ -370,78 +429,6 @@ class CreativityAlgorithms:
         # Limit to top 6 most relevant analogies to avoid overwhelming output
         return prompts[:6]
 
-    def _get_domain_biomimicry(self, domain: str) -> List[Dict[str, str]]:
-        """
-        Get domain-relevant biomimicry examples.
-
-        Args:
-            domain: Target domain for creativity
-
-        Returns:
-            List[Dict[str, str]]: List of biomimicry examples with organism, mechanism, and property
-        """
-        domain_biomimicry_map = {
-            "artificial intelligence": [
-                {"organism": "neural networks", "mechanism": "parallel information processing like brain neurons", "property": "distributed intelligence"},
-                {"organism": "ant colonies", "mechanism": "swarm optimization for collective problem solving", "property": "emergent intelligence"},
-                {"organism": "immune system", "mechanism": "pattern recognition and adaptive memory", "property": "learning from experience"},
-                {"organism": "octopus camouflage", "mechanism": "real-time pattern adaptation", "property": "dynamic response systems"},
-                {"organism": "bird flocking", "mechanism": "simple rules creating complex behavior", "property": "emergent coordination"}
-            ],
-            "renewable energy": [
-                {"organism": "photosynthesis", "mechanism": "converts sunlight to chemical energy efficiently", "property": "solar energy conversion"},
-                {"organism": "wind dispersal seeds", "mechanism": "captures air currents for movement", "property": "wind energy harvesting"},
-                {"organism": "thermoregulation", "mechanism": "maintains optimal temperature with minimal energy", "property": "energy conservation"},
-                {"organism": "bioluminescence", "mechanism": "produces light through chemical reactions", "property": "efficient light generation"},
-                {"organism": "leaf structure", "mechanism": "maximizes surface area for energy capture", "property": "energy collection optimization"}
-            ],
-            "healthcare technology": [
-                {"organism": "immune system", "mechanism": "detects and responds to threats automatically", "property": "automated health monitoring"},
-                {"organism": "blood clotting", "mechanism": "self-healing response to injury", "property": "rapid repair mechanisms"},
-                {"organism": "echolocation", "mechanism": "uses sound waves for internal imaging", "property": "non-invasive diagnostics"},
-                {"organism": "spider silk", "mechanism": "combines strength and flexibility", "property": "biocompatible materials"},
-                {"organism": "cellular repair", "mechanism": "targeted healing at microscopic level", "property": "precision medicine"}
-            ],
-            "cybersecurity": [
-                {"organism": "immune system", "mechanism": "distinguishes self from non-self", "property": "threat identification"},
-                {"organism": "herd immunity", "mechanism": "collective protection through individual immunity", "property": "network security"},
-                {"organism": "camouflage", "mechanism": "blends with environment to avoid detection", "property": "stealth protection"},
-                {"organism": "warning signals", "mechanism": "alerts others to danger", "property": "threat communication"},
-                {"organism": "territorial behavior", "mechanism": "defends boundaries from intruders", "property": "perimeter defense"}
-            ],
-            "product design": [
-                {"organism": "honeycomb structure", "mechanism": "maximizes storage with minimal material", "property": "structural efficiency"},
-                {"organism": "gecko feet", "mechanism": "reversible adhesion without chemicals", "property": "smart attachment"},
-                {"organism": "bird wing design", "mechanism": "optimized shape for efficient movement", "property": "aerodynamic efficiency"},
-                {"organism": "cactus spines", "mechanism": "collects water from air", "property": "resource harvesting"},
-                {"organism": "butterfly wings", "mechanism": "creates colors through structure not pigment", "property": "sustainable aesthetics"}
-            ],
-            "sustainable agriculture": [
-                {"organism": "mycorrhizal networks", "mechanism": "fungi connect plant roots for nutrient sharing", "property": "resource distribution"},
-                {"organism": "nitrogen fixation", "mechanism": "bacteria convert atmospheric nitrogen to plant nutrients", "property": "natural fertilization"},
-                {"organism": "companion planting", "mechanism": "different plants support each other's growth", "property": "symbiotic relationships"},
-                {"organism": "forest succession", "mechanism": "gradual ecosystem development over time", "property": "sustainable regeneration"},
-                {"organism": "pollinator networks", "mechanism": "insects facilitate plant reproduction", "property": "ecosystem services"}
-            ],
-            "urban transportation": [
-                {"organism": "ant trails", "mechanism": "optimizes paths through pheromone feedback", "property": "traffic flow optimization"},
-                {"organism": "bird migration", "mechanism": "efficient long-distance travel in groups", "property": "coordinated movement"},
-                {"organism": "slime mold networks", "mechanism": "finds shortest paths between resources", "property": "route optimization"},
-                {"organism": "schooling fish", "mechanism": "reduces energy through coordinated swimming", "property": "collective efficiency"},
-                {"organism": "honeybee waggle dance", "mechanism": "communicates location information", "property": "navigation systems"}
-            ],
-            "business strategy": [
-                {"organism": "ecosystem dynamics", "mechanism": "species adapt to fill available niches", "property": "market positioning"},
-                {"organism": "predator-prey cycles", "mechanism": "populations balance through feedback loops", "property": "competitive dynamics"},
-                {"organism": "symbiotic relationships", "mechanism": "mutual benefit through cooperation", "property": "strategic partnerships"},
-                {"organism": "territorial behavior", "mechanism": "defends resources from competitors", "property": "market protection"},
-                {"organism": "migration patterns", "mechanism": "moves to exploit seasonal opportunities", "property": "market timing"}
-            ]
-        }
-
-        # Return domain-specific biomimicry examples or fall back to generic ones
-        return domain_biomimicry_map.get(domain, self.biomimicry_examples)
-
     def apply_reverse_brainstorming(self, idea: str) -> List[str]:
         """
         Apply reverse brainstorming by focusing on how to make the idea fail.
@@ -462,126 +449,7 @@ class CreativityAlgorithms:
             "Now, how can we reverse each of these failure modes into innovative features?"
         ]
 
-    def _get_domain_perspectives(self, domain: str) -> Dict[str, List[str]]:
-        """
-        Get domain-specific perspectives for Six Thinking Hats.
-
-        Args:
-            domain: Target domain for creativity
-
-        Returns:
-            Dict[str, List[str]]: Domain-specific prompts for each thinking hat
-        """
-        domain_perspectives = {
-            "artificial intelligence": {
-                "factual": [
-                    f"What AI performance metrics validate this approach?",
-                    f"What training data requirements exist?",
-                    f"What computational resources are needed?",
-                    f"What accuracy benchmarks apply?"
-                ],
-                "emotional": [
-                    f"How do users feel about AI making this decision?",
-                    f"What trust concerns arise with this AI system?",
-                    f"How does this impact human-AI interaction?",
-                    f"What ethical concerns do stakeholders have?"
-                ],
-                "critical": [
-                    f"What bias risks exist in this AI system?",
-                    f"How could this AI system fail or be misused?",
-                    f"What privacy concerns arise?",
-                    f"What happens when the AI encounters edge cases?"
-                ],
-                "positive": [
-                    f"How could this AI system improve decision-making?",
-                    f"What efficiency gains are possible?",
-                    f"How could this democratize AI capabilities?",
-                    f"What new possibilities does this AI enable?"
-                ]
-            },
-            "healthcare technology": {
-                "factual": [
-                    f"What clinical evidence supports this approach?",
-                    f"What regulatory approvals are required?",
-                    f"What patient safety data exists?",
-                    f"What cost-effectiveness studies apply?"
-                ],
-                "emotional": [
-                    f"How do patients feel about this technology?",
-                    f"What concerns do healthcare providers have?",
-                    f"How does this impact patient-provider relationships?",
-                    f"What anxiety or comfort does this create?"
-                ],
-                "critical": [
-                    f"What patient safety risks exist?",
-                    f"How could this technology fail in critical situations?",
-                    f"What privacy concerns arise with health data?",
-                    f"What happens if the technology malfunctions?"
-                ],
-                "positive": [
-                    f"How could this improve patient outcomes?",
-                    f"What healthcare access benefits are possible?",
-                    f"How could this reduce healthcare costs?",
-                    f"What quality of life improvements result?"
-                ]
-            },
-            "cybersecurity": {
-                "factual": [
-                    f"What threat vectors does this address?",
-                    f"What security standards does this meet?",
-                    f"What attack success rates exist?",
-                    f"What compliance requirements apply?"
-                ],
-                "emotional": [
-                    f"How do users feel about security vs. convenience?",
-                    f"What privacy concerns do stakeholders have?",
-                    f"How does this impact user trust?",
-                    f"What fear or confidence does this create?"
-                ],
-                "critical": [
-                    f"What new attack vectors could this create?",
-                    f"How could this security measure be bypassed?",
-                    f"What happens if this security system fails?",
-                    f"What false positive/negative risks exist?"
-                ],
-                "positive": [
-                    f"How could this improve overall security posture?",
-                    f"What threat prevention benefits are possible?",
-                    f"How could this reduce security incidents?",
-                    f"What peace of mind does this provide?"
-                ]
-            },
-            "sustainable agriculture": {
-                "factual": [
-                    f"What yield data supports this approach?",
-                    f"What environmental impact measurements exist?",
-                    f"What cost-benefit analysis applies?",
-                    f"What soil health indicators are relevant?"
-                ],
-                "emotional": [
-                    f"How do farmers feel about adopting this practice?",
-                    f"What concerns do consumers have?",
-                    f"How does this impact farming communities?",
-                    f"What pride or worry does this create?"
-                ],
-                "critical": [
-                    f"What environmental risks could arise?",
-                    f"How could this approach fail in different climates?",
-                    f"What economic risks do farmers face?",
-                    f"What unintended consequences are possible?"
-                ],
-                "positive": [
-                    f"How could this improve soil health?",
-                    f"What biodiversity benefits are possible?",
-                    f"How could this reduce environmental impact?",
-                    f"What long-term sustainability gains result?"
-                ]
-            }
-        }
-
-        return domain_perspectives.get(domain, {})
-
-    def apply_six_thinking_hats(self, idea: str, context: Optional[CreativityContext] = None) -> Dict[str, List[str]]:
+    def apply_six_thinking_hats(self, idea: str, context: Optional[CreativityContext] = None) -> Dict[str, Sequence[str]]:
         """
         Apply Edward de Bono's Six Thinking Hats technique with domain-specific perspectives.
 
@@ -590,10 +458,10 @@ class CreativityAlgorithms:
             context: Optional creativity context for domain-aware perspectives
 
         Returns:
-            Dict[str, List[str]]: Domain-aware prompts organized by thinking hat color
+            Dict[str, Sequence[str]]: Domain-aware prompts organized by thinking hat color
         """
-        domain = context.domain if context else "general innovation"
-        domain_perspectives = self._get_domain_perspectives(domain)
+        domain = context.domain if context else Domain.GENERAL_INNOVATION
+        domain_perspectives = get_domain_perspectives(domain)
 
         # Create domain-aware prompts, falling back to generic ones if domain not found
         return {
@@ -635,27 +503,27 @@ class CreativityAlgorithms:
             ]
         }
     
-    def apply_biomimicry(self, idea: str, context: Optional[CreativityContext] = None) -> List[str]:
+    def apply_biomimicry(self, idea: str, context: Optional[CreativityContext] = None,
+                        rng: Optional[random.Random] = None) -> List[str]:
         """
         Apply biomimicry with domain-relevant natural examples.
 
         Args:
             idea: The original idea
             context: Optional creativity context for domain-aware selection
+            rng: Optional random generator for reproducible selection
 
         Returns:
             List[str]: List of domain-aware biomimicry-inspired prompts
         """
-        domain = context.domain if context else "general innovation"
-        domain_biomimicry = self._get_domain_biomimicry(domain)
+        domain = context.domain if context else Domain.GENERAL_INNOVATION
+        domain_biomimicry = get_domain_biomimicry(domain)
 
-        selected_examples = self._safe_random_sample(domain_biomimicry, 3)
+        selected_examples = self._safe_random_sample(domain_biomimicry, 3, rng)
 
         prompts = []
         for example in selected_examples:
-            organism = example["organism"]
-            mechanism = example["mechanism"]
-            property_desc = example["property"]
+            organism, mechanism, property_desc = example
 
             prompts.extend([
                 f"How could '{idea}' mimic {organism}'s {mechanism} to achieve {property_desc} in {domain}?",
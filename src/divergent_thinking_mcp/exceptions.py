@@ -46,6 +46,10 @@ class ValidationError(DivergentThinkingError):
     This exception is raised when required fields are missing,
     field types are incorrect, or field values are invalid.
     """
+
+    # Longest field value copied verbatim into the error context; longer
+    # values are truncated there, while field_value keeps the original
+    PREVIEW_LENGTH = 50
     
     def __init__(
         self, 
@@ -58,7 +62,10 @@ class ValidationError(DivergentThinkingError):
         if field_name:
             context["field_name"] = field_name
         if field_value is not None:
-            context["field_value"] = str(field_value)
+            preview = str(field_value)
+            if len(preview) > self.PREVIEW_LENGTH:
+                preview = f"{preview[:self.PREVIEW_LENGTH]}..."
+            context["field_value"] = preview
         if expected_type:
             context["expected_type"] = expected_type
             
@@ -5,116 +5,103 @@ This module contains comprehensive tool definitions with proper schemas,
 validation, and documentation for all divergent thinking tools.
 """
 
-from typing import List
+from functools import lru_cache
+from typing import Any, Dict, List
 from mcp.types import Tool
 
 from .mcp_utils import MCPToolBuilder
 from .constants import VALID_DOMAINS
 
+# Unified tool schema, description and examples, built once at import
+_PROPERTIES: Dict[str, Dict[str, Any]] = {
+    "thought": MCPToolBuilder.create_string_property(
+        description="The primary thought, idea, or concept to work with",
+        min_length=1,
+        max_length=5000
+    ),
+    "thinking_method": MCPToolBuilder.create_string_property(
+        description="The divergent thinking method to apply. Choose 'structured_process' for comprehensive multi-turn exploration, or single-shot methods for quick creative input.",
+        enum=[
+            "structured_process",
+            "generate_branches",
+            "perspective_shift",
+            "creative_constraint",
+            "combine_thoughts",
+            "reverse_brainstorming"
+        ],
+        default="structured_process"
+    ),
+    "thought2": MCPToolBuilder.create_string_property(
+        description="Second thought for combination method (required only for combine_thoughts)",
+        min_length=1,
+        max_length=5000
+    ),
+    "constraint": MCPToolBuilder.create_string_property(
+        description="Creative limitation to apply (for creative_constraint method)",
+        max_length=500,
+        default="introduce an impossible element"
+    ),
+    "perspective_type": MCPToolBuilder.create_string_property(
+        description="Viewpoint to adopt (for perspective_shift method)",
+        enum=["inanimate_object", "abstract_concept", "impossible_being"],
+        default="inanimate_object"
+    ),
+    "use_advanced_techniques": MCPToolBuilder.create_boolean_property(
+        description="Enable advanced creativity techniques (Six Thinking Hats, SCAMPER, etc.)",
+        default=False
+    ),
+    "seed": MCPToolBuilder.create_integer_property(
+        description="Random seed for deterministic results (optional)",
+        minimum=1,
+        maximum=999999
+    ),
+    # Interactive Context Parameters (NEW)
+    "domain": MCPToolBuilder.create_string_property(
+        description="REQUIRED: Specific domain/field for targeted creativity context. Must be explicitly specified by agent for precise, relevant creative outputs.",
+        enum=list(VALID_DOMAINS)
+    ),
+    "target_audience": MCPToolBuilder.create_string_property(
+        description="Optional: Target audience for user-centered creative solutions. Specify who will use/benefit from the solution (e.g., 'remote students', 'elderly users', 'small business owners', 'healthcare professionals')",
+        max_length=100
+    ),
+    "time_period": MCPToolBuilder.create_string_property(
+        description="Optional: Time context for temporally-aware creativity. Specify when the solution will be implemented or relevant (e.g., 'current', '2030s', 'next decade', 'post-pandemic era')",
+        max_length=50
+    ),
+    "resources": MCPToolBuilder.create_string_property(
+        description="Optional: Available resources and constraints for realistic innovation. Comma-separated list of what you have to work with (e.g., 'limited budget, cloud infrastructure, mobile devices, government grants')",
+        max_length=500
+    ),
+    "goals": MCPToolBuilder.create_string_property(
+        description="Optional: Specific objectives and success criteria for goal-oriented creativity. Comma-separated list of what you want to achieve (e.g., 'reduce costs, improve user experience, increase accessibility, enhance security')",
+        max_length=500
+    ),
+    # Additional parameters for structured_process
+    "thoughtNumber": MCPToolBuilder.create_integer_property(
+        description="Position of current thought in sequence (for structured_process)",
+        minimum=1,
+        maximum=1000,
+        default=1
+    ),
+    "totalThoughts": MCPToolBuilder.create_integer_property(
+        description="Expected total thoughts in sequence (for structured_process)",
+        minimum=1,
+        maximum=1000,
+        default=3
+    ),
+    "nextThoughtNeeded": MCPToolBuilder.create_boolean_property(
+        description="Whether to continue the thinking sequence (for structured_process)",
+        default=True
+    ),
+    "generate_branches": MCPToolBuilder.create_boolean_property(
+        description="Whether to create multiple divergent paths (for structured_process)",
+        default=False
+    )
+}
 
-def create_divergent_thinking_tools() -> List[Tool]:
-    """
-    Create the unified divergent thinking tool definition.
-
-    Returns:
-        List[Tool]: Single comprehensive MCP tool definition
-    """
-    # Return only the unified tool to reduce agent confusion
-    return [_create_unified_divergent_thinking_tool()]
-
-
-def _create_unified_divergent_thinking_tool() -> Tool:
-    """Create the unified divergent thinking tool definition."""
-
-    properties = {
-        "thought": MCPToolBuilder.create_string_property(
-            description="The primary thought, idea, or concept to work with",
-            min_length=1,
-            max_length=5000
-        ),
-        "thinking_method": MCPToolBuilder.create_string_property(
-            description="The divergent thinking method to apply. Choose 'structured_process' for comprehensive multi-turn exploration, or single-shot methods for quick creative input.",
-            enum=[
-                "structured_process",
-                "generate_branches",
-                "perspective_shift",
-                "creative_constraint",
-                "combine_thoughts",
-                "reverse_brainstorming"
-            ],
-            default="structured_process"
-        ),
-        "thought2": MCPToolBuilder.create_string_property(
-            description="Second thought for combination method (required only for combine_thoughts)",
-            min_length=1,
-            max_length=5000
-        ),
-        "constraint": MCPToolBuilder.create_string_property(
-            description="Creative limitation to apply (for creative_constraint method)",
-            max_length=500,
-            default="introduce an impossible element"
-        ),
-        "perspective_type": MCPToolBuilder.create_string_property(
-            description="Viewpoint to adopt (for perspective_shift method)",
-            enum=["inanimate_object", "abstract_concept", "impossible_being"],
-            default="inanimate_object"
-        ),
-        "use_advanced_techniques": MCPToolBuilder.create_boolean_property(
-            description="Enable advanced creativity techniques (Six Thinking Hats, SCAMPER, etc.)",
-            default=False
-        ),
-        "seed": MCPToolBuilder.create_integer_property(
-            description="Random seed for deterministic results (optional)",
-            minimum=1,
-            maximum=999999
-        ),
-        # Interactive Context Parameters (NEW)
-        "domain": MCPToolBuilder.create_string_property(
-            description="REQUIRED: Specific domain/field for targeted creativity context. Must be explicitly specified by agent for precise, relevant creative outputs.",
-            enum=list(VALID_DOMAINS)
-        ),
-        "target_audience": MCPToolBuilder.create_string_property(
-            description="Optional: Target audience for user-centered creative solutions. Specify who will use/benefit from the solution (e.g., 'remote students', 'elderly users', 'small business owners', 'healthcare professionals')",
-            max_length=100
-        ),
-        "time_period": MCPToolBuilder.create_string_property(
-            description="Optional: Time context for temporally-aware creativity. Specify when the solution will be implemented or relevant (e.g., 'current', '2030s', 'next decade', 'post-pandemic era')",
-            max_length=50
-        ),
-        "resources": MCPToolBuilder.create_string_property(
-            description="Optional: Available resources and constraints for realistic innovation. Comma-separated list of what you have to work with (e.g., 'limited budget, cloud infrastructure, mobile devices, government grants')",
-            max_length=500
-        ),
-        "goals": MCPToolBuilder.create_string_property(
-            description="Optional: Specific objectives and success criteria for goal-oriented creativity. Comma-separated list of what you want to achieve (e.g., 'reduce costs, improve user experience, increase accessibility, enhance security')",
-            max_length=500
-        ),
-        # Additional parameters for structured_process
-        "thoughtNumber": MCPToolBuilder.create_integer_property(
-            description="Position of current thought in sequence (for structured_process)",
-            minimum=1,
-            maximum=1000,
-            default=1
-        ),
-        "totalThoughts": MCPToolBuilder.create_integer_property(
-            description="Expected total thoughts in sequence (for structured_process)",
-            minimum=1,
-            maximum=1000,
-            default=3
-        ),
-        "nextThoughtNeeded": MCPToolBuilder.create_boolean_property(
-            description="Whether to continue the thinking sequence (for structured_process)",
-            default=True
-        ),
-        "generate_branches": MCPToolBuilder.create_boolean_property(
-            description="Whether to create multiple divergent paths (for structured_process)",
-            default=False
-        )
-    }
+_REQUIRED: List[str] = ["thought", "thinking_method", "domain"]
 
-    required = ["thought", "thinking_method", "domain"]
-    
-    description = """A comprehensive tool for generating creative thoughts and breakthrough ideas through structured divergent thinking processes with interactive context specification.
+_DESCRIPTION: str = """A comprehensive tool for generating creative thoughts and breakthrough ideas through structured divergent thinking processes with interactive context specification.
 
 ## 1) CONCISE DESCRIPTION
 This unified tool provides access to 6 powerful creativity methods through a single interface. It offers both comprehensive multi-turn exploration (structured_process) and quick single-shot creative techniques, with agent-driven context specification for more targeted and relevant creative outputs.
@@ -194,86 +181,102 @@ This unified tool provides access to 6 powerful creativity methods through a sin
 7. **Use seed parameter** when you need consistent, reproducible creative outputs across multiple runs
 8. **Iterate thoughtfully** - let each creative output inform your next exploration direction
 9. **Be specific with context** - the more precise your domain and context parameters, the more targeted and useful the creative output"""
-    
-    examples = [
-        {
-            "description": "Complete structured creative exploration (RECOMMENDED DEFAULT)",
-            "parameters": {
-                "thought": "Develop sustainable transportation solution",
-                "thinking_method": "structured_process",
-                "domain": "urban transportation",
-                "use_advanced_techniques": True
-            }
-        },
-        {
-            "description": "Agent-driven context specification for targeted creativity",
-            "parameters": {
-                "thought": "Create an innovative learning platform",
-                "thinking_method": "structured_process",
-                "domain": "educational technology",
-                "target_audience": "remote students",
-                "time_period": "2025-2030",
-                "resources": "cloud computing, mobile devices, limited budget",
-                "goals": "improve engagement, reduce costs, increase accessibility"
-            }
-        },
-        {
-            "description": "Domain-specific creative branching",
-            "parameters": {
-                "thought": "Design a smart home security system",
-                "thinking_method": "generate_branches",
-                "domain": "cybersecurity",
-                "target_audience": "elderly users",
-                "goals": "ease of use, reliability, affordability"
-            }
-        },
-        {
-            "description": "Context-aware creative constraints",
-            "parameters": {
-                "thought": "Develop a food delivery service",
-                "thinking_method": "creative_constraint",
-                "domain": "e-commerce",
-                "constraint": "must work without smartphones",
-                "target_audience": "rural communities",
-                "resources": "limited internet, local partnerships"
-            }
-        },
-        {
-            "description": "Time-specific perspective shifting",
-            "parameters": {
-                "thought": "Reimagine public transportation",
-                "thinking_method": "perspective_shift",
-                "domain": "urban transportation",
-                "time_period": "2050",
-                "perspective_type": "impossible_being",
-                "goals": "zero emissions, universal accessibility"
-            }
-        },
-        {
-            "description": "Minimal required parameters",
-            "parameters": {
-                "thought": "Create a new type of office chair",
-                "thinking_method": "generate_branches",
-                "domain": "product design"
-            }
-        },
-        {
-            "description": "Domain-focused constraint creativity with minimal context",
-            "parameters": {
-                "thought": "Design eco-friendly packaging",
-                "thinking_method": "creative_constraint",
-                "domain": "sustainable agriculture",
-                "constraint": "must be made from recycled materials"
-            }
+
+_EXAMPLES: List[Dict[str, Any]] = [
+    {
+        "description": "Complete structured creative exploration (RECOMMENDED DEFAULT)",
+        "parameters": {
+            "thought": "Develop sustainable transportation solution",
+            "thinking_method": "structured_process",
+            "domain": "urban transportation",
+            "use_advanced_techniques": True
+        }
+    },
+    {
+        "description": "Agent-driven context specification for targeted creativity",
+        "parameters": {
+            "thought": "Create an innovative learning platform",
+            "thinking_method": "structured_process",
+            "domain": "educational technology",
+            "target_audience": "remote students",
+            "time_period": "2025-2030",
+            "resources": "cloud computing, mobile devices, limited budget",
+            "goals": "improve engagement, reduce costs, increase accessibility"
+        }
+    },
+    {
+        "description": "Domain-specific creative branching",
+        "parameters": {
+            "thought": "Design a smart home security system",
+            "thinking_method": "generate_branches",
+            "domain": "cybersecurity",
+            "target_audience": "elderly users",
+            "goals": "ease of use, reliability, affordability"
+        }
+    },
+    {
+        "description": "Context-aware creative constraints",
+        "parameters": {
+            "thought": "Develop a food delivery service",
+            "thinking_method": "creative_constraint",
+            "domain": "e-commerce",
+            "constraint": "must work without smartphones",
+            "target_audience": "rural communities",
+            "resources": "limited internet, local partnerships"
         }
-    ]
-    
+    },
+    {
+        "description": "Time-specific perspective shifting",
+        "parameters": {
+            "thought": "Reimagine public transportation",
+            "thinking_method": "perspective_shift",
+            "domain": "urban transportation",
+            "time_period": "2050",
+            "perspective_type": "impossible_being",
+            "goals": "zero emissions, universal accessibility"
+        }
+    },
+    {
+        "description": "Minimal required parameters",
+        "parameters": {
+            "thought": "Create a new type of office chair",
+            "thinking_method": "generate_branches",
+            "domain": "product design"
+        }
+    },
+    {
+        "description": "Domain-focused constraint creativity with minimal context",
+        "parameters": {
+            "thought": "Design eco-friendly packaging",
+            "thinking_method": "creative_constraint",
+            "domain": "sustainable agriculture",
+            "constraint": "must be made from recycled materials"
+        }
+    }
+]
+
+
+def create_divergent_thinking_tools() -> List[Tool]:
+    """
+    Create the unified divergent thinking tool definition.
+
+    Returns:
+        List[Tool]: Single comprehensive MCP tool definition
+    """
+    # Return only the unified tool to reduce agent confusion. The list is
+    # fresh per call; the Tool itself is built once and shared.
+    return [_create_unified_divergent_thinking_tool()]
+
+
+@lru_cache(maxsize=1)
+def _create_unified_divergent_thinking_tool() -> Tool:
+    """Create the unified divergent thinking tool definition (built once per process)."""
     return MCPToolBuilder.create_tool(
         name="divergent_thinking",
-        description=description,
-        properties=properties,
-        required=required,
-        examples=examples
+        description=_DESCRIPTION,
+        properties=_PROPERTIES,
+        required=_REQUIRED,
+        examples=_EXAMPLES
     )
 
 
@@ -6,10 +6,131 @@ of input data used in divergent thinking operations.
 """
 
 import re
-from typing import Any, Dict, List, Optional, Set
+import string
+import sys
+from functools import lru_cache
+from typing import AbstractSet, Any, Dict, Final, FrozenSet, List, Optional, Set
 from .exceptions import ValidationError
 from .constants import VALID_DOMAINS
 
+# Harmful-content patterns merged into one alternation so the content is
+# scanned once. The patterns are pure ASCII, so ASCII case folding is enough;
+# the tag body is matched possessively since it can never give back a '>'.
+_HARMFUL_PATTERN = re.compile(
+    r'<script\b[^>]*+>'  # Script tags
+    r'|javascript:'      # JavaScript URLs
+    r'|data:text/html'   # Data URLs with HTML
+    r'|vbscript:',       # VBScript URLs
+    re.IGNORECASE | re.ASCII,
+)
+
+# Length of the longest URL scheme name in _HARMFUL_PATTERN ("javascript")
+_LONGEST_SCHEME_LENGTH: Final[int] = len('javascript')
+
+# Characters allowed in branch IDs: ASCII alphanumerics, hyphens and
+# underscores, as bytes so bytes.translate() can delete them in one C pass
+_BRANCH_ID_BYTES = (string.ascii_letters + string.digits + '_-').encode('ascii')
+
+# Validation bounds, read directly by the static validators and exposed as
+# ThoughtValidator attributes
+_MIN_THOUGHT_LENGTH: Final[int] = 1
+_MAX_THOUGHT_LENGTH: Final[int] = 5000
+_MIN_CONSTRAINT_LENGTH: Final[int] = 1
+_MAX_CONSTRAINT_LENGTH: Final[int] = 500
+_MAX_TARGET_AUDIENCE_LENGTH: Final[int] = 100
+_MAX_TIME_PERIOD_LENGTH: Final[int] = 50
+_MAX_RESOURCES_LENGTH: Final[int] = 500
+_MAX_GOALS_LENGTH: Final[int] = 500
+
+# Valid values for enum-like fields, interned so tokens that are already
+# interned match on identity before any string comparison
+_VALID_PROMPT_TYPES: Final[FrozenSet[str]] = frozenset(map(sys.intern, (
+    "branch_generation",
+    "creative_constraint",
+    "perspective_shift",
+    "combination"
+)))
+
+_VALID_PERSPECTIVE_TYPES: Final[FrozenSet[str]] = frozenset(map(sys.intern, (
+    "inanimate_object",
+    "abstract_concept",
+    "impossible_being"
+)))
+
+# Sorted choice lists for the error messages of the built-in enum sets,
+# keyed by the sets themselves so any equal frozenset finds its entry
+_ENUM_CHOICES: Dict[FrozenSet[str], str] = {
+    valid_values: ', '.join(sorted(valid_values))
+    for valid_values in (_VALID_PROMPT_TYPES, _VALID_PERSPECTIVE_TYPES)
+}
+
+
+def _contains_harmful_content(content: str) -> bool:
+    """
+    Check if content contains potentially harmful patterns.
+
+    Args:
+        content: Content to check
+
+    Returns:
+        bool: True if harmful content is detected
+    """
+    # Every pattern contains '<' or ':', which are unaffected by case, so
+    # content without either skips the scan without making a lowered copy.
+    # Otherwise the regex only scans from the earliest point a match could
+    # begin.
+    start = content.find('<')
+    colon = content.find(':')
+    if colon != -1:
+        # URL schemes end at the colon, so their match begins earlier
+        colon = max(colon - _LONGEST_SCHEME_LENGTH, 0)
+        if start == -1 or colon < start:
+            start = colon
+    elif start == -1:
+        return False
+
+    return _HARMFUL_PATTERN.search(content, start) is not None
+
+
+# Longest raw branch ID that is memoized by _clean_branch_id
+_CACHED_BRANCH_ID_LENGTH: Final[int] = 128
+
+
+@lru_cache(maxsize=4096)
+def _clean_branch_id(branch_id: str) -> str:
+    """
+    Strip and check the format of a branch ID string.
+
+    Branch IDs are re-validated many times per session, so results are
+    memoized; invalid IDs raise and are therefore never cached.
+
+    Args:
+        branch_id: The raw branch ID string
+
+    Returns:
+        str: The cleaned branch ID
+
+    Raises:
+        ValidationError: If the branch ID is empty or badly formatted
+    """
+    cleaned_id = branch_id.strip()
+    if not cleaned_id:
+        raise ValidationError(
+            "branchId cannot be empty",
+            field_name="branchId",
+            field_value=branch_id
+        )
+
+    # Validate format (alphanumeric with hyphens and underscores)
+    if not cleaned_id.isascii() or cleaned_id.encode('ascii').translate(None, _BRANCH_ID_BYTES):
+        raise ValidationError(
+            "branchId must contain only alphanumeric characters, hyphens, and underscores",
+            field_name="branchId",
+            field_value=branch_id
+        )
+
+    return cleaned_id
+
 
 class ThoughtValidator:
     """
@@ -18,42 +139,35 @@ class ThoughtValidator:
     Provides methods to validate thought content, metadata, and parameters
     used in divergent thinking operations.
     """
+
+    # A namespace of static validators; instances carry no state
+    __slots__ = ()
     
     # Valid values for enum-like fields
-    VALID_PROMPT_TYPES: Set[str] = {
-        "branch_generation", 
-        "creative_constraint", 
-        "perspective_shift", 
-        "combination"
-    }
-    
-    VALID_PERSPECTIVE_TYPES: Set[str] = {
-        "inanimate_object", 
-        "abstract_concept", 
-        "impossible_being"
-    }
+    VALID_PROMPT_TYPES: Final[FrozenSet[str]] = _VALID_PROMPT_TYPES
+    VALID_PERSPECTIVE_TYPES: Final[FrozenSet[str]] = _VALID_PERSPECTIVE_TYPES
     
     # Validation constraints
-    MIN_THOUGHT_LENGTH = 1
-    MAX_THOUGHT_LENGTH = 5000
-    MIN_CONSTRAINT_LENGTH = 1
-    MAX_CONSTRAINT_LENGTH = 500
-    MIN_THOUGHT_NUMBER = 1
-    MAX_THOUGHT_NUMBER = 1000
-    MIN_TOTAL_THOUGHTS = 1
-    MAX_TOTAL_THOUGHTS = 1000
+    MIN_THOUGHT_LENGTH: Final[int] = _MIN_THOUGHT_LENGTH
+    MAX_THOUGHT_LENGTH: Final[int] = _MAX_THOUGHT_LENGTH
+    MIN_CONSTRAINT_LENGTH: Final[int] = _MIN_CONSTRAINT_LENGTH
+    MAX_CONSTRAINT_LENGTH: Final[int] = _MAX_CONSTRAINT_LENGTH
+    MIN_THOUGHT_NUMBER: Final[int] = 1
+    MAX_THOUGHT_NUMBER: Final[int] = 1000
+    MIN_TOTAL_THOUGHTS: Final[int] = 1
+    MAX_TOTAL_THOUGHTS: Final[int] = 1000
 
     # Interactive context parameter constraints
-    MAX_TARGET_AUDIENCE_LENGTH = 100
-    MAX_TIME_PERIOD_LENGTH = 50
-    MAX_RESOURCES_LENGTH = 500
-    MAX_GOALS_LENGTH = 500
+    MAX_TARGET_AUDIENCE_LENGTH: Final[int] = _MAX_TARGET_AUDIENCE_LENGTH
+    MAX_TIME_PERIOD_LENGTH: Final[int] = _MAX_TIME_PERIOD_LENGTH
+    MAX_RESOURCES_LENGTH: Final[int] = _MAX_RESOURCES_LENGTH
+    MAX_GOALS_LENGTH: Final[int] = _MAX_GOALS_LENGTH
 
     # Valid domain values (multi-word domains)
-    VALID_DOMAINS: Set[str] = VALID_DOMAINS
+    VALID_DOMAINS: Final[Set[str]] = VALID_DOMAINS
     
-    @classmethod
-    def validate_required_fields(cls, data: Dict[str, Any], required_fields: List[str]) -> None:
+    @staticmethod
+    def validate_required_fields(data: Dict[str, Any], required_fields: List[str]) -> None:
         """
         Validate that all required fields are present in the data.
         
@@ -71,8 +185,8 @@ class ThoughtValidator:
                 field_name=missing_fields[0] if len(missing_fields) == 1 else None
             )
     
-    @classmethod
-    def validate_thought_content(cls, thought: Any, field_name: str = "thought") -> str:
+    @staticmethod
+    def validate_thought_content(thought: Any, field_name: str = "thought") -> str:
         """
         Validate thought content string.
         
@@ -94,24 +208,30 @@ class ThoughtValidator:
                 expected_type="string"
             )
         
-        # Clean and validate length
-        cleaned_thought = thought.strip()
-        if len(cleaned_thought) < cls.MIN_THOUGHT_LENGTH:
+        # Clean and validate length; well-formed input is used as-is to
+        # avoid copying it
+        if thought[:1].isspace() or thought[-1:].isspace():
+            cleaned_thought = thought.strip()
+        else:
+            cleaned_thought = thought
+        min_length = _MIN_THOUGHT_LENGTH
+        max_length = _MAX_THOUGHT_LENGTH
+        length = len(cleaned_thought)
+        if not min_length <= length <= max_length:
+            if length < min_length:
+                raise ValidationError(
+                    f"{field_name} must be at least {min_length} character(s) long",
+                    field_name=field_name,
+                    field_value=thought
+                )
             raise ValidationError(
-                f"{field_name} must be at least {cls.MIN_THOUGHT_LENGTH} character(s) long",
+                f"{field_name} must be at most {max_length} characters long",
                 field_name=field_name,
                 field_value=thought
             )
         
-        if len(cleaned_thought) > cls.MAX_THOUGHT_LENGTH:
-            raise ValidationError(
-                f"{field_name} must be at most {cls.MAX_THOUGHT_LENGTH} characters long",
-                field_name=field_name,
-                field_value=f"{thought[:50]}..."
-            )
-        
         # Check for potentially harmful content (basic sanitization)
-        if cls._contains_harmful_content(cleaned_thought):
+        if _contains_harmful_content(cleaned_thought):
             raise ValidationError(
                 f"{field_name} contains potentially harmful content",
                 field_name=field_name
@@ -119,9 +239,8 @@ class ThoughtValidator:
         
         return cleaned_thought
     
-    @classmethod
+    @staticmethod
     def validate_integer_field(
-        cls, 
         value: Any, 
         field_name: str, 
         min_value: int, 
@@ -150,7 +269,7 @@ class ThoughtValidator:
                 expected_type="integer"
             )
         
-        if value < min_value or value > max_value:
+        if not min_value <= value <= max_value:
             raise ValidationError(
                 f"{field_name} must be between {min_value} and {max_value}",
                 field_name=field_name,
@@ -159,8 +278,8 @@ class ThoughtValidator:
         
         return value
     
-    @classmethod
-    def validate_boolean_field(cls, value: Any, field_name: str) -> bool:
+    @staticmethod
+    def validate_boolean_field(value: Any, field_name: str) -> bool:
         """
         Validate boolean field.
         
@@ -184,12 +303,11 @@ class ThoughtValidator:
         
         return value
     
-    @classmethod
+    @staticmethod
     def validate_enum_field(
-        cls, 
         value: Any, 
         field_name: str, 
-        valid_values: Set[str],
+        valid_values: AbstractSet[str],
         required: bool = True
     ) -> Optional[str]:
         """
@@ -207,6 +325,10 @@ class ThoughtValidator:
         Raises:
             ValidationError: If value is invalid
         """
+        # Fast path for the common case of an exact, valid string token
+        if type(value) is str and value in valid_values:
+            return value
+
         if value is None:
             if required:
                 raise ValidationError(
@@ -224,16 +346,24 @@ class ThoughtValidator:
             )
         
         if value not in valid_values:
+            # Mutable sets are unhashable, so only frozensets can be looked up
+            choices = (
+                _ENUM_CHOICES.get(valid_values)
+                if isinstance(valid_values, frozenset)
+                else None
+            )
+            if choices is None:
+                choices = ', '.join(sorted(valid_values))
             raise ValidationError(
-                f"{field_name} must be one of: {', '.join(sorted(valid_values))}",
+                f"{field_name} must be one of: {choices}",
                 field_name=field_name,
                 field_value=value
             )
         
         return value
     
-    @classmethod
-    def validate_constraint(cls, constraint: Any) -> str:
+    @staticmethod
+    def validate_constraint(constraint: Any) -> str:
         """
         Validate creative constraint content.
         
@@ -254,25 +384,30 @@ class ThoughtValidator:
                 expected_type="string"
             )
         
-        cleaned_constraint = constraint.strip()
-        if len(cleaned_constraint) < cls.MIN_CONSTRAINT_LENGTH:
+        if constraint[:1].isspace() or constraint[-1:].isspace():
+            cleaned_constraint = constraint.strip()
+        else:
+            cleaned_constraint = constraint
+        min_length = _MIN_CONSTRAINT_LENGTH
+        max_length = _MAX_CONSTRAINT_LENGTH
+        length = len(cleaned_constraint)
+        if not min_length <= length <= max_length:
+            if length < min_length:
+                raise ValidationError(
+                    f"constraint must be at least {min_length} character(s) long",
+                    field_name="constraint",
+                    field_value=constraint
+                )
             raise ValidationError(
-                f"constraint must be at least {cls.MIN_CONSTRAINT_LENGTH} character(s) long",
+                f"constraint must be at most {max_length} characters long",
                 field_name="constraint",
                 field_value=constraint
             )
         
-        if len(cleaned_constraint) > cls.MAX_CONSTRAINT_LENGTH:
-            raise ValidationError(
-                f"constraint must be at most {cls.MAX_CONSTRAINT_LENGTH} characters long",
-                field_name="constraint",
-                field_value=f"{constraint[:50]}..."
-            )
-        
         return cleaned_constraint
     
-    @classmethod
-    def validate_branch_id(cls, branch_id: Any) -> str:
+    @staticmethod
+    def validate_branch_id(branch_id: Any) -> str:
         """
         Validate branch identifier.
         
@@ -292,27 +427,16 @@ class ThoughtValidator:
                 field_value=branch_id,
                 expected_type="string"
             )
+
+        # Only short IDs go through the cache, so its memory stays bounded;
+        # longer ones get the same checks uncached
+        if len(branch_id) > _CACHED_BRANCH_ID_LENGTH:
+            return _clean_branch_id.__wrapped__(branch_id)
         
-        cleaned_id = branch_id.strip()
-        if not cleaned_id:
-            raise ValidationError(
-                "branchId cannot be empty",
-                field_name="branchId",
-                field_value=branch_id
-            )
-        
-        # Validate format (alphanumeric with hyphens and underscores)
-        if not re.match(r'^[a-zA-Z0-9_-]+$', cleaned_id):
-            raise ValidationError(
-                "branchId must contain only alphanumeric characters, hyphens, and underscores",
-                field_name="branchId",
-                field_value=branch_id
-            )
-        
-        return cleaned_id
+        return _clean_branch_id(branch_id)
 
-    @classmethod
-    def validate_domain(cls, domain: Any) -> str:
+    @staticmethod
+    def validate_domain(domain: Any) -> str:
         """
         Validate domain parameter.
 
@@ -341,7 +465,7 @@ class ThoughtValidator:
                 field_value=domain
             )
 
-        if cleaned_domain not in cls.VALID_DOMAINS:
+        if cleaned_domain not in VALID_DOMAINS:
             raise ValidationError(
                 f"domain must be one of the valid multi-word domains. "
                 f"Received: '{cleaned_domain}'. "
@@ -350,10 +474,12 @@ class ThoughtValidator:
                 field_value=cleaned_domain
             )
 
-        return cleaned_domain
+        # Hand back the canonical interned object so downstream domain-table
+        # lookups hit the identity fast path.
+        return sys.intern(cleaned_domain)
 
-    @classmethod
-    def validate_target_audience(cls, audience: Any) -> Optional[str]:
+    @staticmethod
+    def validate_target_audience(audience: Any) -> Optional[str]:
         """
         Validate target audience parameter.
 
@@ -381,15 +507,15 @@ class ThoughtValidator:
         if not cleaned_audience:
             return None
 
-        if len(cleaned_audience) > cls.MAX_TARGET_AUDIENCE_LENGTH:
+        if len(cleaned_audience) > _MAX_TARGET_AUDIENCE_LENGTH:
             raise ValidationError(
-                f"target_audience must be at most {cls.MAX_TARGET_AUDIENCE_LENGTH} characters long",
+                f"target_audience must be at most {_MAX_TARGET_AUDIENCE_LENGTH} characters long",
                 field_name="target_audience",
-                field_value=f"{audience[:50]}..."
+                field_value=audience
             )
 
         # Check for potentially harmful content
-        if cls._contains_harmful_content(cleaned_audience):
+        if _contains_harmful_content(cleaned_audience):
             raise ValidationError(
                 "target_audience contains potentially harmful content",
                 field_name="target_audience"
@@ -397,8 +523,8 @@ class ThoughtValidator:
 
         return cleaned_audience
 
-    @classmethod
-    def validate_time_period(cls, period: Any) -> Optional[str]:
+    @staticmethod
+    def validate_time_period(period: Any) -> Optional[str]:
         """
         Validate time period parameter.
 
@@ -426,15 +552,15 @@ class ThoughtValidator:
         if not cleaned_period:
             return None
 
-        if len(cleaned_period) > cls.MAX_TIME_PERIOD_LENGTH:
+        if len(cleaned_period) > _MAX_TIME_PERIOD_LENGTH:
             raise ValidationError(
-                f"time_period must be at most {cls.MAX_TIME_PERIOD_LENGTH} characters long",
+                f"time_period must be at most {_MAX_TIME_PERIOD_LENGTH} characters long",
                 field_name="time_period",
-                field_value=f"{period[:30]}..."
+                field_value=period
             )
 
         # Check for potentially harmful content
-        if cls._contains_harmful_content(cleaned_period):
+        if _contains_harmful_content(cleaned_period):
             raise ValidationError(
                 "time_period contains potentially harmful content",
                 field_name="time_period"
@@ -442,8 +568,8 @@ class ThoughtValidator:
 
         return cleaned_period
 
-    @classmethod
-    def validate_resources(cls, resources: Any) -> Optional[str]:
+    @staticmethod
+    def validate_resources(resources: Any) -> Optional[str]:
         """
         Validate resources parameter (comma-separated string).
 
@@ -471,15 +597,15 @@ class ThoughtValidator:
         if not cleaned_resources:
             return None
 
-        if len(cleaned_resources) > cls.MAX_RESOURCES_LENGTH:
+        if len(cleaned_resources) > _MAX_RESOURCES_LENGTH:
             raise ValidationError(
-                f"resources must be at most {cls.MAX_RESOURCES_LENGTH} characters long",
+                f"resources must be at most {_MAX_RESOURCES_LENGTH} characters long",
                 field_name="resources",
-                field_value=f"{resources[:50]}..."
+                field_value=resources
             )
 
         # Check for potentially harmful content
-        if cls._contains_harmful_content(cleaned_resources):
+        if _contains_harmful_content(cleaned_resources):
             raise ValidationError(
                 "resources contains potentially harmful content",
                 field_name="resources"
@@ -503,8 +629,8 @@ class ThoughtValidator:
 
         return ", ".join(valid_items)
 
-    @classmethod
-    def validate_goals(cls, goals: Any) -> Optional[str]:
+    @staticmethod
+    def validate_goals(goals: Any) -> Optional[str]:
         """
         Validate goals parameter (comma-separated string).
 
@@ -532,15 +658,15 @@ class ThoughtValidator:
         if not cleaned_goals:
             return None
 
-        if len(cleaned_goals) > cls.MAX_GOALS_LENGTH:
+        if len(cleaned_goals) > _MAX_GOALS_LENGTH:
             raise ValidationError(
-                f"goals must be at most {cls.MAX_GOALS_LENGTH} characters long",
+                f"goals must be at most {_MAX_GOALS_LENGTH} characters long",
                 field_name="goals",
-                field_value=f"{goals[:50]}..."
+                field_value=goals
             )
 
         # Check for potentially harmful content
-        if cls._contains_harmful_content(cleaned_goals):
+        if _contains_harmful_content(cleaned_goals):
             raise ValidationError(
                 "goals contains potentially harmful content",
                 field_name="goals"
@@ -564,28 +690,4 @@ class ThoughtValidator:
 
         return ", ".join(valid_items)
 
-    @classmethod
-    def _contains_harmful_content(cls, content: str) -> bool:
-        """
-        Check if content contains potentially harmful patterns.
-        
-        Args:
-            content: Content to check
-            
-        Returns:
-            bool: True if harmful content is detected
-        """
-        # Basic patterns to detect potentially harmful content
-        harmful_patterns = [
-            r'<script[^>]*>',  # Script tags
-            r'javascript:',     # JavaScript URLs
-            r'data:text/html',  # Data URLs with HTML
-            r'vbscript:',      # VBScript URLs
-        ]
-        
-        content_lower = content.lower()
-        for pattern in harmful_patterns:
-            if re.search(pattern, content_lower):
-                return True
-        
-        return False
+    _contains_harmful_content = staticmethod(_contains_harmful_content)
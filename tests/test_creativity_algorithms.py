@@ -380,6 +380,61 @@ class TestDomainAwareCreativity:
         # Should reference the domain
         assert "renewable energy" in combined_results
 
+    def test_biomimicry_examples_are_named_tuples(self, algorithms):
+        """Test that biomimicry examples expose organism, mechanism, and property fields."""
+        from divergent_thinking_mcp.constants import BiomimicryExample
+        from divergent_thinking_mcp.creativity_algorithms import get_domain_biomimicry
+
+        for domain in ("renewable energy", "unknown domain"):
+            examples = get_domain_biomimicry(domain)
+            assert examples
+            for example in examples:
+                assert isinstance(example, BiomimicryExample)
+                assert example.organism and example.mechanism and example.property
+
+    def test_domain_getters_return_stored_tables(self):
+        """Test that domain getters return the shared tables rather than copies."""
+        from divergent_thinking_mcp import constants
+        from divergent_thinking_mcp.creativity_algorithms import (
+            get_domain_analogies,
+            get_domain_biomimicry,
+            get_domain_perspectives,
+        )
+
+        domain = "cybersecurity"
+        assert get_domain_analogies(domain) is constants.DOMAIN_ANALOGIES[domain]
+        assert get_domain_biomimicry(domain) is constants.DOMAIN_BIOMIMICRY[domain]
+
+        # Misses fall back to the same generic objects on every call
+        assert get_domain_analogies("unknown domain") is constants.ANALOGICAL_DOMAINS
+        assert get_domain_biomimicry("unknown domain") is constants.BIOMIMICRY_EXAMPLES
+        assert get_domain_perspectives("unknown domain") is get_domain_perspectives("other domain")
+        with pytest.raises(TypeError):
+            get_domain_perspectives("unknown domain")["factual"] = ()
+
+    def test_has_domain(self):
+        """Test membership checks against the precomputed domain set."""
+        from divergent_thinking_mcp.creativity_algorithms import ALL_DOMAINS, has_domain
+
+        assert has_domain("cybersecurity")
+        assert has_domain("general innovation")
+        assert not has_domain("unknown domain")
+        assert isinstance(ALL_DOMAINS, frozenset)
+
+    def test_lookups_dispatch_table(self):
+        """Test that the dispatch table exposes the module-level getters."""
+        from divergent_thinking_mcp.creativity_algorithms import (
+            LOOKUPS,
+            get_creativity_words,
+            get_domain_analogies,
+        )
+
+        assert LOOKUPS["analogies"] is get_domain_analogies
+        assert LOOKUPS["words"] is get_creativity_words
+        assert LOOKUPS["perspectives"]("cybersecurity")
+        with pytest.raises(TypeError):
+            LOOKUPS["analogies"] = get_creativity_words
+
     def test_domain_aware_six_thinking_hats(self, algorithms):
         """Test Six Thinking Hats with domain-specific perspectives."""
         context = CreativityContext(domain="healthcare technology", constraints=[])
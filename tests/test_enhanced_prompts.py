@@ -5,6 +5,9 @@ This module tests the enhanced prompt generation capabilities
 that integrate creativity algorithms with structured templates.
 """
 
+import random
+from types import MappingProxyType
+
 import pytest
 from divergent_thinking_mcp.enhanced_prompts import EnhancedPromptGenerator
 from divergent_thinking_mcp.creativity_algorithms import CreativityTechnique, CreativityContext
@@ -140,6 +143,43 @@ class TestEnhancedPromptGenerator:
         assert constraint in prompt
         assert "relaxing this constraint" in prompt
     
+    def test_safe_random_sample_three_distinct(self, generator):
+        """Test that the three-item fast path returns distinct items and covers all positions."""
+        items = ["a", "b", "c", "d", "e"]
+        seen = set()
+        for seed in range(200):
+            random.seed(seed)
+            sample = generator._safe_random_sample(items, 3)
+            assert len(sample) == 3
+            assert len(set(sample)) == 3
+            seen.update(sample)
+        assert seen == set(items)
+
+        assert sorted(generator._safe_random_sample(["x", "y"], 3)) == ["x", "y"]
+        assert generator._safe_random_sample([], 3) == []
+
+    def test_seeded_prompts_leave_global_random_state_untouched(self, generator):
+        """Test that seeded generation is reproducible without reseeding the global RNG."""
+        state = random.getstate()
+        first = generator.generate_enhanced_branch_prompt(
+            "Design a bicycle", technique=CreativityTechnique.RANDOM_WORD, seed=7
+        )
+        assert random.getstate() == state
+
+        second = generator.generate_enhanced_branch_prompt(
+            "Design a bicycle", technique=CreativityTechnique.RANDOM_WORD, seed=7
+        )
+        assert first == second
+
+    def test_template_substitution_is_single_pass(self, generator):
+        """Test that placeholders inside user text are not substituted again."""
+        thought = "Render {constraint} and {unknown} literally"
+        constraint = "no {thought} recursion"
+        prompt = generator.generate_enhanced_constraint_prompt(thought, constraint, seed=1)
+
+        assert thought in prompt
+        assert constraint in prompt
+
     def test_generate_enhanced_combination_prompt_basic(self, generator):
         """Test enhanced combination prompt generation."""
         thought1 = "Voice-controlled smart home"
@@ -225,28 +265,31 @@ class TestPromptTemplateLoading:
     def test_perspective_templates_loaded(self):
         """Test that perspective templates are properly loaded."""
         generator = EnhancedPromptGenerator()
-        
-        assert hasattr(generator, 'perspective_templates')
-        assert isinstance(generator.perspective_templates, dict)
-        assert "inanimate_object" in generator.perspective_templates
-        assert "abstract_concept" in generator.perspective_templates
-        assert "impossible_being" in generator.perspective_templates
+        perspective_templates = generator._PERSPECTIVE_TEMPLATES
+
+        assert isinstance(perspective_templates, MappingProxyType)
+        assert "inanimate_object" in perspective_templates
+        assert "abstract_concept" in perspective_templates
+        assert "impossible_being" in perspective_templates
+        assert all(
+            isinstance(templates, tuple)
+            for templates in perspective_templates.values()
+        )
+        assert "perspective_templates" not in vars(generator)
     
     def test_constraint_templates_loaded(self):
         """Test that constraint templates are properly loaded."""
         generator = EnhancedPromptGenerator()
-        
-        assert hasattr(generator, 'constraint_templates')
-        assert isinstance(generator.constraint_templates, list)
-        assert len(generator.constraint_templates) > 0
+
+        assert isinstance(generator._CONSTRAINT_TEMPLATES, tuple)
+        assert len(generator._CONSTRAINT_TEMPLATES) > 0
     
     def test_combination_templates_loaded(self):
         """Test that combination templates are properly loaded."""
         generator = EnhancedPromptGenerator()
-        
-        assert hasattr(generator, 'combination_templates')
-        assert isinstance(generator.combination_templates, list)
-        assert len(generator.combination_templates) > 0
+
+        assert isinstance(generator._COMBINATION_TEMPLATES, tuple)
+        assert len(generator._COMBINATION_TEMPLATES) > 0
 
 
 class TestIntegration:
@@ -272,6 +315,7 @@ class TestIntegration:
 
         assert hasattr(generator, 'creativity_algorithms')
         assert generator.creativity_algorithms is not None
+        assert generator.creativity_algorithms is EnhancedPromptGenerator().creativity_algorithms
 
     def test_end_to_end_workflow(self, generator, sample_context):
         """Test complete workflow from context to final prompt."""
@@ -28,6 +28,16 @@ class TestRequiredDomainValidation:
         assert "domain" in divergent_tool.inputSchema["required"]
         assert "thought" in divergent_tool.inputSchema["required"]
         assert "thinking_method" in divergent_tool.inputSchema["required"]
+
+    def test_tool_definition_is_built_once(self):
+        """Test that repeated tool listings share a single Tool instance."""
+        from divergent_thinking_mcp.tool_definitions import create_divergent_thinking_tools
+
+        first = create_divergent_thinking_tools()
+        second = create_divergent_thinking_tools()
+
+        assert first is not second
+        assert first[0] is second[0]
     
     def test_validate_domain_success(self):
         """Test successful domain validation with valid multi-word domains."""
@@ -43,7 +53,18 @@ class TestRequiredDomainValidation:
         for domain in valid_domains:
             result = ThoughtValidator.validate_domain(domain)
             assert result == domain
-    
+
+    def test_validate_domain_returns_canonical_key(self):
+        """Test that validated domains are the interned keys of the domain tables."""
+        from divergent_thinking_mcp.constants import DOMAIN_CREATIVITY_WORDS
+
+        # Build the string at runtime so it is a distinct object from the literal
+        raw = " ".join(["artificial", "intelligence"]) + "  "
+        result = ThoughtValidator.validate_domain(raw)
+
+        canonical = next(key for key in DOMAIN_CREATIVITY_WORDS if key == result)
+        assert result is canonical
+
     def test_validate_domain_invalid_type(self):
         """Test domain validation fails with non-string types."""
         invalid_types = [123, None, [], {}, True]
@@ -323,6 +344,24 @@ class TestDomainEnumCompleteness:
         assert len(business_domains) >= 5, f"Expected at least 5 business domains, got {len(business_domains)}"
         assert len(health_domains) >= 5, f"Expected at least 5 health domains, got {len(health_domains)}"
 
+    def test_domain_enum_members_are_valid_table_keys(self):
+        """Test that Domain members are valid domains usable as table keys."""
+        from divergent_thinking_mcp.constants import (
+            Domain,
+            DOMAIN_ANALOGIES,
+            DOMAIN_BIOMIMICRY,
+            DOMAIN_PERSPECTIVES,
+        )
+
+        assert set(Domain) <= ThoughtValidator.VALID_DOMAINS
+
+        # Every domain with a dedicated table has an enum member
+        table_domains = set(DOMAIN_ANALOGIES) | set(DOMAIN_BIOMIMICRY) | set(DOMAIN_PERSPECTIVES)
+        assert table_domains <= set(Domain)
+
+        assert DOMAIN_ANALOGIES[Domain.CYBERSECURITY] is DOMAIN_ANALOGIES["cybersecurity"]
+        assert f"{Domain.GENERAL_INNOVATION}" == "general innovation"
+
 
 class TestErrorHandlingAndEdgeCases:
     """Test suite for error handling and edge cases."""
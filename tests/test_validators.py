@@ -6,7 +6,7 @@ and other input validation requirements.
 """
 
 import pytest
-from divergent_thinking_mcp.validators import ThoughtValidator
+from divergent_thinking_mcp.validators import ThoughtValidator, _clean_branch_id
 from divergent_thinking_mcp.exceptions import ValidationError
 
 
@@ -53,6 +53,15 @@ class TestThoughtValidator:
         for thought in valid_thoughts:
             result = ThoughtValidator.validate_thought_content(thought)
             assert result == thought.strip()
+
+    def test_validate_thought_content_whitespace(self):
+        """Test that surrounding whitespace is stripped and clean input is reused."""
+        thought = "Design an innovative product"
+        assert ThoughtValidator.validate_thought_content(thought) is thought
+        assert ThoughtValidator.validate_thought_content(f"\t{thought}\u3000") == thought
+
+        with pytest.raises(ValidationError):
+            ThoughtValidator.validate_thought_content(" \n ")
     
     def test_validate_thought_content_invalid_type(self):
         """Test thought content validation with invalid types."""
@@ -93,6 +102,37 @@ class TestThoughtValidator:
                 ThoughtValidator.validate_thought_content(thought)
             assert "harmful content" in str(exc_info.value)
     
+    def test_validate_thought_content_harmful_mixed_case(self):
+        """Test that harmful content is detected regardless of letter case."""
+        for thought in ["<SCRIPT src='x'>", "Click JavaScript:run()", "VBScript:msgbox", "DATA:TEXT/HTML,x"]:
+            with pytest.raises(ValidationError):
+                ThoughtValidator.validate_thought_content(thought)
+
+        assert ThoughtValidator.validate_thought_content("Describe a script: act one") == "Describe a script: act one"
+        # A marker alone is not enough; the full pattern must match
+        assert ThoughtValidator.validate_thought_content("Compare <script tags") == "Compare <script tags"
+
+    def test_validate_thought_content_script_tag_boundaries(self):
+        """Test that only complete script tag names are flagged."""
+        long_tag = "<script " + "a" * 1000 + ">"
+        with pytest.raises(ValidationError):
+            ThoughtValidator.validate_thought_content(long_tag)
+
+        assert ThoughtValidator.validate_thought_content("<scriptorium>") == "<scriptorium>"
+
+    def test_validate_thought_content_harmful_after_other_markers(self):
+        """Test that harmful patterns are found after harmless '<' or ':' characters."""
+        harmful_thoughts = [
+            "javascript:void(0)",
+            "Note: then javascript:run()",
+            "a < b and " + "x" * 200 + "vbscript:x",
+            "Plan: <b>bold</b> <script src='x'>",
+            "Ratio 3:2 data:text/html,x",
+        ]
+        for thought in harmful_thoughts:
+            with pytest.raises(ValidationError):
+                ThoughtValidator.validate_thought_content(thought)
+
     def test_validate_integer_field_success(self):
         """Test successful integer field validation."""
         valid_values = [1, 5, 100, 999]
@@ -160,6 +200,34 @@ class TestThoughtValidator:
                 "invalid_option", "testField", valid_values
             )
         assert "must be one of" in str(exc_info.value)
+
+    def test_validate_enum_field_builtin_choices(self):
+        """Test the error message for the built-in enum sets."""
+        with pytest.raises(ValidationError) as exc_info:
+            ThoughtValidator.validate_enum_field(
+                "invalid_option", "prompt_type", ThoughtValidator.VALID_PROMPT_TYPES
+            )
+        assert (
+            "must be one of: branch_generation, combination, creative_constraint, perspective_shift"
+            in str(exc_info.value)
+        )
+        assert isinstance(ThoughtValidator.VALID_PERSPECTIVE_TYPES, frozenset)
+
+        # An equal frozenset built elsewhere gets the same message
+        with pytest.raises(ValidationError) as exc_info:
+            ThoughtValidator.validate_enum_field(
+                "invalid_option", "perspective_type",
+                frozenset({"impossible_being", "inanimate_object", "abstract_concept"})
+            )
+        assert "must be one of: abstract_concept, impossible_being, inanimate_object" in str(exc_info.value)
+
+    def test_validate_enum_field_rejects_unhashable(self):
+        """Test that unhashable values fail the type check instead of the lookup."""
+        with pytest.raises(ValidationError) as exc_info:
+            ThoughtValidator.validate_enum_field(
+                ["combination"], "prompt_type", ThoughtValidator.VALID_PROMPT_TYPES
+            )
+        assert "must be a string" in str(exc_info.value)
     
     def test_validate_enum_field_optional(self):
         """Test enum field validation with optional field."""
@@ -234,11 +302,37 @@ class TestThoughtValidator:
         assert "cannot be empty" in str(exc_info.value)
         
         # Invalid characters
-        invalid_ids = ["branch with spaces", "branch@special", "branch/slash"]
+        invalid_ids = ["branch with spaces", "branch@special", "branch/slash", "brañch", "branch\u0663"]
         for branch_id in invalid_ids:
             with pytest.raises(ValidationError) as exc_info:
                 ThoughtValidator.validate_branch_id(branch_id)
             assert "alphanumeric characters" in str(exc_info.value)
+
+    def test_validate_branch_id_cached(self):
+        """Test that repeated branch IDs are served from the cache."""
+        _clean_branch_id.cache_clear()
+        first = ThoughtValidator.validate_branch_id(" cached-branch ")
+        second = ThoughtValidator.validate_branch_id(" cached-branch ")
+        assert first == "cached-branch"
+        assert second is first
+        assert _clean_branch_id.cache_info().hits == 1
+
+        # Failures are not cached and keep raising
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                ThoughtValidator.validate_branch_id("bad id")
+        assert _clean_branch_id.cache_info().currsize == 1
+
+    def test_validate_branch_id_long_not_cached(self):
+        """Test that long branch IDs are validated without being cached."""
+        _clean_branch_id.cache_clear()
+        long_id = "b" * 1000
+        assert ThoughtValidator.validate_branch_id(f"  {long_id}  ") == long_id
+        assert _clean_branch_id.cache_info().currsize == 0
+
+        with pytest.raises(ValidationError) as exc_info:
+            ThoughtValidator.validate_branch_id("b" * 1000 + "!")
+        assert "alphanumeric characters" in str(exc_info.value)
     
     def test_class_constants(self):
         """Test that class constants are properly defined."""
@@ -288,3 +382,12 @@ class TestValidationErrorHandling:
             assert error_dict["message"] is not None
             assert error_dict["error_code"] == "VALIDATION_ERROR"
             assert "context" in error_dict
+
+    def test_validation_error_truncates_long_values(self):
+        """Test that long field values are only truncated in the error context."""
+        long_thought = "A" * 6000
+        with pytest.raises(ValidationError) as exc_info:
+            ThoughtValidator.validate_thought_content(long_thought)
+        error = exc_info.value
+        assert error.field_value == long_thought
+        assert error.context["field_value"] == "A" * 50 + "..."